@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import multiprocessing
 import random
 import typing
 from collections import defaultdict
@@ -8,8 +9,9 @@ from dataclasses import dataclass
 from functools import partial
 from itertools import groupby
 from math import sqrt
-from typing import Callable, Iterable, Protocol, TypeVar
+from typing import Callable, Iterable, Protocol, TypeVar, cast
 
+from numba import threading_layer  # type: ignore
 from tqdm import tqdm  # type: ignore
 
 from .boards import Scoreboard, ScoreboardPrinter
@@ -32,6 +34,42 @@ class __Printer(Protocol):
         ...  # pragma: no cover
 
 
+# The engine used by each worker process in a benchmark. It is sent to every worker
+# once, via the pool initializer, rather than being pickled alongside every chunk of
+# games. The score matrix itself lives in shared memory so is never copied.
+_worker_engine: Engine | SimulEngine | None = None
+
+
+def _init_worker(engine: Engine | SimulEngine) -> None:
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _create_executor(engine: Engine | SimulEngine) -> ProcessPoolExecutor:
+    # Forking a process whose Numba kernels have started TBB's threads can deadlock, so
+    # workers are only spawned when TBB is in use. Otherwise, the platform's default is kept.
+    context = multiprocessing.get_context("spawn") if _is_using_tbb() else None
+    return ProcessPoolExecutor(mp_context=context, initializer=_init_worker, initargs=(engine,))
+
+
+def _is_using_tbb() -> bool:
+    try:
+        return threading_layer() == "tbb"
+    except ValueError:
+        # No parallel kernel has run yet, so no threading layer has been started
+        return False
+
+
+def _run_game(soln: Word, user_guesses: list[Word]) -> Game:
+    engine = cast(Engine, _worker_engine)
+    return engine.run(soln, user_guesses)
+
+
+def _run_simul_game(solns: list[Word], user_guesses: list[Word]) -> SimultaneousGame:
+    engine = cast(SimulEngine, _worker_engine)
+    return engine.run(solns, user_guesses)
+
+
 @dataclass
 class Benchmark:
     guesses: list[Word]
@@ -131,8 +169,8 @@ class Benchmark:
             solns = potential_solns
             for i, guess in enumerate(guesses):
                 score = scorer.score_word(soln, guess)
-                solns_by_score = histogram_builder.get_solns_by_score(solns, guess)
-                solns = solns_by_score[score]
+                scores = histogram_builder.get_scores(solns, guess)
+                solns = solns[scores == score]
                 ternary = to_ternary(score, size)
                 scoreboard.add_row(i + 1, soln, guess, ternary, len(solns))
 
@@ -204,12 +242,12 @@ class Benchmarker:
             user_guesses (list[Word]): The opening guesses.
         """
         dictionary = self.engine.dictionary
-        f = partial(self.engine.run, user_guesses=user_guesses)
+        f = partial(_run_game, user_guesses=user_guesses)
 
         total = len(dictionary.common_words)
         histogram: defaultdict[int, int] = defaultdict(int)
         solved_games: list[Game] = []
-        with ProcessPoolExecutor() as executor:
+        with _create_executor(self.engine) as executor:
             games = executor.map(f, dictionary.common_words, chunksize=20)
             for game in tqdm(games, total=total):
                 solved_games.append(game)
@@ -241,7 +279,7 @@ class SimulBenchmarker:
         random.seed(13)
 
         dictionary = self.engine.dictionary
-        f = partial(self.engine.run, user_guesses=user_guesses)
+        f = partial(_run_simul_game, user_guesses=user_guesses)
 
         def generate_games() -> Iterable[list[Word]]:
             dict_size = len(dictionary.common_words)
@@ -257,7 +295,7 @@ class SimulBenchmarker:
 
         solved_games: list[SimultaneousGame] = []
         histogram: defaultdict[int, int] = defaultdict(int)
-        with ProcessPoolExecutor() as executor:
+        with _create_executor(self.engine) as executor:
             games = executor.map(f, game_factory, chunksize=20)
             for game in tqdm(games, total=num_runs):
                 solved_games.append(game)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import sys
 from argparse import ArgumentParser, Namespace
 from typing import Sequence
@@ -11,8 +13,9 @@ from .factory import (
     create_simul_benchmarker,
     create_simul_engine,
 )
+from .histogram import CACHED_WORD_LENGTH
 from .views import HideView, SolveView
-from .words import Word
+from .words import Word, load_dictionary
 
 
 def solve(args: Namespace) -> None:
@@ -23,12 +26,16 @@ def solve(args: Namespace) -> None:
     size: int = len(guess) if guess else args.size
     extras = [guess] if guess else None
 
+    lazy_eval = not _is_worth_precomputing(size, extras)
     dictionary, scorer, histogram_builder, solver, _ = create_models(
-        size, solver_type=solver_type, depth=depth, extras=extras
+        size, solver_type=solver_type, depth=depth, extras=extras, lazy_eval=lazy_eval
     )
 
     view = SolveView(size)
-    controller = SolveController(dictionary, scorer, histogram_builder, solver, view)
+    # Solve the likeliest outcomes of each guess in the background while the user enters its score.
+    # Searches deeper than one move take too long for this to pay off.
+    speculate = 32 if depth == 1 else 0
+    controller = SolveController(dictionary, scorer, histogram_builder, solver, view, speculate)
     controller.solve(guess)
 
 
@@ -56,15 +63,41 @@ def run(args: Namespace) -> None:
     guesses = guess.split(",") if guess else []
     extras = solutions + guesses
     size = len(solutions[0])
+    lazy_eval = not _is_worth_precomputing(size, extras)
 
     if len(solutions) == 1:
-        engine = create_engine(size, solver_type=solver_type, depth=depth, extras=extras)
+        engine = create_engine(
+            size, solver_type=solver_type, depth=depth, extras=extras, lazy_eval=lazy_eval
+        )
         engine.run(solution, guesses)
     else:
-        simul_engine = create_simul_engine(size, solver_type=solver_type, depth=depth, extras=extras)
+        simul_engine = create_simul_engine(
+            size, solver_type=solver_type, depth=depth, extras=extras, lazy_eval=lazy_eval
+        )
         simul_engine.run(solutions, guesses)
 
 
+def _is_worth_precomputing(size: int, extras: Sequence[Word] | None) -> bool:
+    """Whether to score every word upfront rather than as and when they are seen.
+
+    Only then can the score matrix be loaded from, or saved to, the cache. The cache
+    only holds matrices of one word length and an extra word that is not already an
+    answer would change the matrix.
+
+    Args:
+        size (int): The word length.
+        extras (Sequence[Word] | None): Any extra words to include in the dictionary.
+
+    Returns:
+        bool: Returns True if the score matrix should be precomputed.
+    """
+    if size != CACHED_WORD_LENGTH:
+        return False
+
+    common_words = load_dictionary(size).common_words
+    return all(extra in common_words for extra in extras or [])
+
+
 def benchmark_performance(args: Namespace) -> None:
 
     guess: Word | None = args.guess
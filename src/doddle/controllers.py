@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass
 
+import numpy as np
+
+from .guess import Guess
 from .histogram import HistogramBuilder
 from .scoring import Scorer
 from .solver import Solver
 from .views import HideView, SolveView
-from .words import Dictionary, Word
+from .words import Dictionary, Word, WordSeries
 
 
 @dataclass
@@ -18,6 +22,7 @@ class SolveController:
     histogram_builder: HistogramBuilder
     solver: Solver
     view: SolveView
+    speculate: int = 0
 
     def solve(self, first_guess: Word | None) -> bool:
         """Solves a game given an optional opening guess.
@@ -32,20 +37,65 @@ class SolveController:
         best_guess = first_guess or self.solver.seed(all_words.word_length)
 
         while True:
-            (observed_score, best_guess) = self.view.get_user_score(best_guess)
+            # Leaving the block waits for a speculative guess that is already running, so that
+            # the Numba kernels never run on two threads at once. Queued guesses are cancelled.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                speculative_guesses = self._speculate(executor, all_words, available_answers, best_guess)
+                (observed_score, guess) = self.view.get_user_score(best_guess)
+                is_speculated = guess == best_guess and observed_score in speculative_guesses
+                future = speculative_guesses.pop(observed_score) if is_speculated else None
+                for speculative_guess in speculative_guesses.values():
+                    speculative_guess.cancel()
+
             if self.scorer.is_perfect_score(observed_score):
                 self.view.report_success()
                 return True
 
-            histogram = self.histogram_builder.get_solns_by_score(available_answers, best_guess)
-            if observed_score not in histogram:
+            scores = self.histogram_builder.get_scores(available_answers, guess)
+            available_answers = available_answers[scores == observed_score]
+            if len(available_answers) == 0:
                 self.view.report_no_solution()
                 return False
 
-            available_answers = histogram[observed_score]
-            best_guess = self.solver.get_best_guess(all_words, available_answers).word
+            if future:
+                best_guess = future.result().word
+            else:
+                best_guess = self.solver.get_best_guess(all_words, available_answers).word
             self.view.report_best_guess(best_guess)
 
+    def _speculate(
+        self, executor: Executor, all_words: WordSeries, available_answers: WordSeries, guess: Word
+    ) -> dict[int, Future[Guess]]:
+        """Starts solving the likeliest outcomes of a guess while the user enters its score.
+
+        The outcomes are queued from the largest bucket of answers down, up to the number
+        set by speculate. A speculative guess is only used if the user plays the guess as
+        suggested and reports one of these outcomes.
+
+        Args:
+            executor (Executor): The executor that solves each outcome in the background.
+            all_words (WordSeries): All the words that may be guessed.
+            available_answers (WordSeries): The words that could still be the solution.
+            guess (Word): The guess about to be played.
+
+        Returns:
+            dict[int, Future[Guess]]: The future best guess for each speculated score.
+        """
+        if self.speculate <= 0:
+            return {}
+
+        scores = self.histogram_builder.get_scores(available_answers, guess)
+        counts = np.bincount(scores, minlength=self.scorer.perfect_score + 1)
+        counts[self.scorer.perfect_score] = 0
+        likeliest_scores = np.argsort(-counts, kind="stable")[: self.speculate]
+
+        speculative_guesses: dict[int, Future[Guess]] = {}
+        for score in likeliest_scores[counts[likeliest_scores] > 0]:
+            answers = available_answers[scores == score]
+            future = executor.submit(self.solver.get_best_guess, all_words, answers)
+            speculative_guesses[int(score)] = future
+        return speculative_guesses
+
 
 @dataclass
 class HideController:
@@ -65,16 +115,18 @@ class HideController:
         available_answers = self.dictionary.common_words
         guess = first_guess or self.view.get_user_guess()
 
+        perfect_score = self.scorer.perfect_score
         MAX_ITERS = 100
         for i in range(1, MAX_ITERS):
-            histogram = self.histogram_builder.get_solns_by_score(available_answers, guess)
+            scores = self.histogram_builder.get_scores(available_answers, guess)
 
-            def rank_score(score: int) -> int:
-                solutions = histogram[score]
-                return 0 if guess in solutions else len(solutions)
+            # The largest bucket wins, ties going to the lowest score. The perfect bucket is
+            # only conceded when there is nothing else left, so it never counts towards a tie.
+            counts = np.bincount(scores, minlength=perfect_score + 1)
+            counts[perfect_score] = 0
+            highest_score = int(counts.argmax()) if counts.any() else perfect_score
 
-            highest_score = max(histogram, key=rank_score)
-            available_answers = histogram[highest_score]
+            available_answers = available_answers[scores == highest_score]
             self.view.update(i, guess, highest_score, available_answers)
 
             if self.scorer.is_perfect_score(highest_score):
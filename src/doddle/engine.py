@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .exceptions import FailedToFindASolutionError
 from .game import Game, SimultaneousGame
@@ -10,7 +10,7 @@ from .scoring import Scorer
 from .simul_solver import SimulSolver
 from .solver import Solver
 from .views import RunReporter
-from .words import Dictionary, Word
+from .words import Dictionary, Word, WordSeries
 
 
 @dataclass
@@ -22,6 +22,7 @@ class Engine:
     histogram_builder: HistogramBuilder
     solver: Solver[Guess]
     reporter: RunReporter
+    _best_guesses: dict[tuple[int, bytes], Word] = field(default_factory=dict, init=False, repr=False)
 
     def run(self, solution: Word, user_guesses: list[Word]) -> Game:
         """Runs a Doddle game.
@@ -43,19 +44,41 @@ class Engine:
 
         MAX_ITERS = 20
         for i in range(1, MAX_ITERS + 1):
-            histogram = self.histogram_builder.get_solns_by_score(available_answers, guess)
+            scores = self.histogram_builder.get_scores(available_answers, guess)
             score = self.scorer.score_word(solution, guess)
-            available_answers = histogram[score]
+            available_answers = available_answers[scores == score]
             game.update(i, guess, score, available_answers)
             self.reporter.display(game)
 
             if game.is_solved:
                 return game
 
-            guess = game.user_guess(i) or self.solver.get_best_guess(all_words, available_answers).word
+            guess = game.user_guess(i) or self._get_best_guess(i, all_words, available_answers)
 
         raise FailedToFindASolutionError(f"Failed to converge after {MAX_ITERS} iterations.")
 
+    def _get_best_guess(self, turn: int, all_words: WordSeries, available_answers: WordSeries) -> Word:
+        """Gets the solver's best guess, reusing it if the same position has been seen before.
+
+        Games sharing an opening guess are narrowed to the same few hundred positions after the
+        first turn, so the engine remembers the guess for each turn and set of remaining answers
+        rather than solving the same position again.
+
+        Args:
+            turn (int): The number of guesses made so far.
+            all_words (WordSeries): All the words that may be guessed.
+            available_answers (WordSeries): The words that could still be the solution.
+
+        Returns:
+            Word: The best guess.
+        """
+        key = (turn, available_answers.index.tobytes())
+        best_guess = self._best_guesses.get(key)
+        if best_guess is None:
+            best_guess = self.solver.get_best_guess(all_words, available_answers).word
+            self._best_guesses[key] = best_guess
+        return best_guess
+
 
 @dataclass
 class SimulEngine:
@@ -90,9 +113,9 @@ class SimulEngine:
                 if game.is_solved:
                     continue
                 available_answers = game.potential_solns
-                histogram = self.histogram_builder.get_solns_by_score(available_answers, guess)
+                scores = self.histogram_builder.get_scores(available_answers, guess)
                 score = self.scorer.score_word(game.soln, guess)
-                new_available_answers = histogram[score]
+                new_available_answers = available_answers[scores == score]
                 simul_game.update(i, game, guess, score, new_available_answers)
 
             self.reporter.display(simul_game)
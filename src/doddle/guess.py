@@ -8,6 +8,9 @@ import numpy as np
 
 from .words import Word
 
+# Entropies closer than this are considered equal when comparing guesses
+ENTROPY_TOLERANCE = 1e-9
+
 
 class Guess(Protocol):  # pragma: no cover
     """Strucural protocol for a guess."""
@@ -59,16 +62,25 @@ class MinimaxGuess:
         Returns:
             bool: Whether the guess improves upon the other guess.
         """
-        if self.size_of_largest_bucket != other.size_of_largest_bucket:
-            return self.size_of_largest_bucket < other.size_of_largest_bucket
+        return self.sort_key() < other.sort_key()
 
-        if self.is_potential_soln != other.is_potential_soln:
-            return self.is_potential_soln
+    def sort_key(self) -> tuple[int, bool, int, str]:
+        """A key such that better guesses have smaller keys.
 
-        if self.number_of_buckets != other.number_of_buckets:
-            return self.number_of_buckets > other.number_of_buckets
+        Guesses are ranked by the size of their largest bucket, then by whether they
+        are a potential solution, then by the number of buckets and finally
+        alphabetically. Sorting via the key (e.g. min(guesses, key=MinimaxGuess.sort_key))
+        compares tuples in C rather than calling improves_upon for every comparison.
 
-        return self.word < other.word
+        Returns:
+            tuple[int, bool, int, str]: The sort key.
+        """
+        return (
+            self.size_of_largest_bucket,
+            not self.is_potential_soln,
+            -self.number_of_buckets,
+            self.word.value,
+        )
 
     def perfectly_partitions(self) -> bool:
         """Whether a guess partitions the histogram into buckets of size one.
@@ -158,7 +170,7 @@ class EntropyGuess:
             bool: Whether the guess improves upon the other guess.
         """
 
-        if not isclose(self.entropy, other.entropy, abs_tol=1e-9):
+        if not isclose(self.entropy, other.entropy, abs_tol=ENTROPY_TOLERANCE):
             return self.entropy > other.entropy
 
         if self.is_potential_soln != other.is_potential_soln:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from multiprocessing import current_process
 from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
 from typing import Callable, Iterator, TypeVar
 
 import numpy as np
-from numba import njit  # type: ignore
+from numba import get_num_threads, njit, prange  # type: ignore
 
 from .guess import Guess
 from .scoring import Scorer
@@ -13,6 +16,28 @@ from .words import Word, WordSeries
 
 TGuess = TypeVar("TGuess", bound=Guess)
 
+# Bump whenever the scores change so that persisted score matrices are recomputed
+SCORE_MATRIX_CACHE_VERSION = 2
+
+# Only matrices of this word length are persisted. Longer words take as long to load from
+# disk as to score lazily, and shorter words are quick to score upfront.
+CACHED_WORD_LENGTH = 5
+
+# The minimax search is only split across threads when each guess has this many solutions
+# to score. Each thread takes several chunks as pruning leaves some chunks cheaper than others.
+MIN_SOLNS_FOR_PARALLEL_SEARCH = 100
+PARALLEL_SEARCH_CHUNKS_PER_THREAD = 4
+
+# The statistics of a guess, as computed by HistogramBuilder.evaluate_all_guesses(...)
+GUESS_STATS_DTYPE = np.dtype(
+    [
+        ("largest", np.int64),
+        ("num_buckets", np.int64),
+        ("is_potential_soln", np.bool_),
+        ("entropy", np.float64),
+    ]
+)
+
 
 class HistogramBuilder:
     """
@@ -51,6 +76,11 @@ class HistogramBuilder:
         self.score_matrix = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval)
         self.scorer = scorer
 
+        # A bucket can hold at most every potential solution so we tabulate log2 of every
+        # possible count upfront (with log2(0) taken to be 0) to save evaluating it per bucket.
+        max_count = self.score_matrix.shape[1]
+        self._log2_counts = np.log2(np.maximum(np.arange(max_count + 1), 1))
+
     def get_solns_by_score(self, potential_solns: WordSeries, guess: Word) -> dict[int, WordSeries]:
         """Gets a histogram of all the remaining solutions bucketed by score given a guess.
 
@@ -62,18 +92,37 @@ class HistogramBuilder:
             dict[int, WordSeries]: A dictionary of potential solutions, partitioned by score.
         """
 
-        score_func = np.vectorize(self.scorer.score_word)
-        scores = score_func(potential_solns.words, guess)
-        unique_scores, positions = np.unique(scores, return_inverse=True)
+        scores = self.get_scores(potential_solns, guess)
+
+        # Scores are dense and bounded so we can bucket them in linear time: count each
+        # score, then slice a stable ordering of the solutions at the cumulative counts.
+        counts = np.bincount(scores, minlength=self.scorer.perfect_score + 1)
+        ends = np.cumsum(counts)
+        order = np.argsort(scores, kind="stable")
 
         solns_by_score: dict[int, WordSeries] = {}
-        for (i, unique_score) in enumerate(unique_scores):
-            maps_to_score = positions == i
-            filtered_solns = potential_solns[maps_to_score]
-            solns_by_score[unique_score] = filtered_solns
+        for score in np.flatnonzero(counts):
+            end = ends[score]
+            start = end - counts[score]
+            solns_by_score[int(score)] = potential_solns[order[start:end]]
 
         return solns_by_score
 
+    def get_scores(self, potential_solns: WordSeries, guess: Word) -> np.ndarray:
+        """Gets the score of a guess against each of the remaining solutions.
+
+        Args:
+            potential_solns (WordSeries): The remaining words that could be a solution.
+            guess (Word): The guess.
+
+        Returns:
+            np.ndarray: The vector of scores, aligned with potential_solns.
+        """
+        scores = self.score_matrix.get_scores(potential_solns, guess)
+        if scores is None:
+            scores = self.scorer.score_words(potential_solns, guess)
+        return scores
+
     def stream(
         self,
         all_words: WordSeries,
@@ -112,6 +161,75 @@ class HistogramBuilder:
             is_potential_soln = _populate_histogram(scores, i, histogram)
             yield guess_factory(word, is_potential_soln, histogram)
 
+    def evaluate_all_guesses(self, all_words: WordSeries, potential_solns: WordSeries) -> np.ndarray:
+        """Computes the statistics of every word, as a guess, in a single parallel pass.
+
+        Rather than building a guess object (and a histogram) for every word, the
+        statistics are returned as a structured array so that the solvers can rank the
+        candidates in bulk and only build guess objects for the best of them.
+
+        Args:
+          all_words (WordSeries):
+            The list of all words that could be guessed
+
+          potential_solns (WordSeries):
+            The remaining words that could be solutions
+
+        Returns:
+          np.ndarray:
+            A structured array of GUESS_STATS_DTYPE, aligned with all_words.
+        """
+        self.score_matrix.precompute(potential_solns)
+        largest, num_buckets, is_potential_soln, entropy = _evaluate_all_guesses(
+            self.score_matrix._storage,
+            all_words.index,
+            potential_solns.index,
+            self.scorer.perfect_score + 1,
+            self._log2_counts,
+        )
+
+        stats = np.empty(len(all_words), dtype=GUESS_STATS_DTYPE)
+        stats["largest"] = largest
+        stats["num_buckets"] = num_buckets
+        stats["is_potential_soln"] = is_potential_soln
+        stats["entropy"] = entropy
+        return stats
+
+    def minimax_best(
+        self, all_words: WordSeries, potential_solns: WordSeries
+    ) -> tuple[int, int, int, bool]:
+        """Finds the best guess under the minimax heuristic.
+
+        Equivalent to taking the best of evaluate_all_guesses, but any guess is abandoned as soon
+        as one of its buckets outgrows the largest bucket of the best guess found so far.
+
+        Args:
+          all_words (WordSeries):
+            The list of all words that could be guessed
+
+          potential_solns (WordSeries):
+            The remaining words that could be solutions
+
+        Returns:
+          tuple[int, int, int, bool]:
+            The position of the best guess in all_words, the size of its largest bucket,
+            its number of buckets and whether it is a potential solution.
+        """
+        self.score_matrix.precompute(potential_solns)
+        storage = self.score_matrix._storage
+        num_scores = self.scorer.perfect_score + 1
+        args = (storage, all_words.index, potential_solns.index, num_scores)
+
+        # Threads only pay for themselves once there are enough solutions to score per guess
+        num_threads = get_num_threads()
+        if num_threads > 1 and len(potential_solns) >= MIN_SOLNS_FOR_PARALLEL_SEARCH:
+            best = _minimax_best_parallel(*args, PARALLEL_SEARCH_CHUNKS_PER_THREAD * num_threads)
+        else:
+            best = _minimax_best_of_range(*args, 0, len(all_words))
+
+        largest, is_not_potential_soln, negative_num_buckets, i = best
+        return int(i), int(largest), -int(negative_num_buckets), not is_not_potential_soln
+
     @staticmethod
     def _allocate_histogram_vector(word_length: int) -> np.ndarray:
         """Allocates a vector that can be recycled.
@@ -134,7 +252,7 @@ def to_histogram(solns_by_score: dict[int, WordSeries]) -> np.ndarray:
     return vector
 
 
-@njit
+@njit(cache=True)
 def _populate_histogram(matrix: np.ndarray, row: int, hist: np.ndarray) -> bool:
     """Aggressive optimisation of the histogram creation.
 
@@ -162,6 +280,139 @@ def _populate_histogram(matrix: np.ndarray, row: int, hist: np.ndarray) -> bool:
     return is_potential_soln
 
 
+@njit(parallel=True, cache=True)
+def _evaluate_all_guesses(
+    matrix: np.ndarray, rows: np.ndarray, cols: np.ndarray, num_scores: int, log2_counts: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Builds the histogram of every guess in parallel and reduces each to its statistics.
+
+    With N solutions and c solutions in a bucket, the entropy -sum(c/N * log2(c/N)) is
+    rearranged to log2(N) - sum(c * log2(c)) / N so that only integer counts are ever
+    passed to log2. These are looked up in a precomputed table.
+
+    Args:
+        matrix (np.ndarray): The internal, precomputed score matrix
+        rows (np.ndarray): The rows in the score matrix corresponding to each guess
+        cols (np.ndarray): The columns in the score matrix corresponding to each solution
+        num_scores (int): The number of possible scores
+        log2_counts (np.ndarray): The log2 of every count from zero to N, with log2(0) as 0
+
+    Returns:
+        The size of the largest bucket, the number of buckets, whether the guess is a
+        potential solution and the entropy of the guess, for each guess.
+    """
+    num_guesses, num_solns = len(rows), len(cols)
+    largest = np.zeros(num_guesses, dtype=np.int64)
+    num_buckets = np.zeros(num_guesses, dtype=np.int64)
+    is_potential_soln = np.zeros(num_guesses, dtype=np.bool_)
+    entropy = np.zeros(num_guesses, dtype=np.float64)
+
+    for i in prange(num_guesses):
+        hist = np.zeros(num_scores, dtype=np.int64)
+        for j in cols:
+            hist[matrix[rows[i], j]] += 1
+        largest[i] = hist.max()
+        num_buckets[i] = np.count_nonzero(hist)
+        is_potential_soln[i] = hist[-1] > 0
+
+        weighted_log2_counts = 0.0
+        for count in hist:
+            weighted_log2_counts += count * log2_counts[count]
+        entropy[i] = log2_counts[num_solns] - weighted_log2_counts / num_solns
+        if is_potential_soln[i]:
+            entropy[i] += 1 / num_solns
+
+    return largest, num_buckets, is_potential_soln, entropy
+
+
+@njit(cache=True)
+def _minimax_best_of_range(
+    matrix: np.ndarray, rows: np.ndarray, cols: np.ndarray, num_scores: int, start: int, stop: int
+) -> tuple[int, bool, int, int]:
+    """Minimax search with early termination over the guesses from start to stop.
+
+    Guesses are ranked by the size of their largest bucket, then by whether they are
+    a potential solution, then by the number of buckets and finally by position. As
+    soon as any bucket exceeds the largest bucket of the best guess found so far, the
+    guess cannot win and we move on without building the rest of its histogram.
+
+    Args:
+        matrix (np.ndarray): The internal, precomputed score matrix
+        rows (np.ndarray): The rows in the score matrix corresponding to each guess
+        cols (np.ndarray): The columns in the score matrix corresponding to each solution
+        num_scores (int): The number of possible scores
+        start (int): The position of the first guess to search
+        stop (int): The position after the last guess to search
+
+    Returns:
+        The rank of the best guess: the size of its largest bucket, whether it is not a
+        potential solution, its negated number of buckets and its position. A position of
+        -1 means there were no guesses to search.
+    """
+    hist = np.zeros(num_scores, dtype=np.int64)
+    best = (len(cols) + 1, True, 0, -1)
+
+    for i in range(start, stop):
+        hist[:] = 0
+        largest = 0
+        for j in cols:
+            score = matrix[rows[i], j]
+            hist[score] += 1
+            largest = max(largest, hist[score])
+            if largest > best[0]:
+                break
+        else:
+            candidate = (largest, hist[-1] == 0, -np.count_nonzero(hist), i)
+            if candidate < best:
+                best = candidate
+
+    return best
+
+
+@njit(parallel=True, cache=True)
+def _minimax_best_parallel(
+    matrix: np.ndarray, rows: np.ndarray, cols: np.ndarray, num_scores: int, num_chunks: int
+) -> tuple[int, bool, int, int]:
+    """Minimax search with early termination, splitting the guesses into chunks across cores.
+
+    Each chunk is searched with a bound of its own. A guess abandoned within a chunk has
+    a bucket larger than that of the chunk's best guess, so it cannot be the overall best
+    either and the result is identical to searching every guess in a single pass.
+
+    Args:
+        matrix (np.ndarray): The internal, precomputed score matrix
+        rows (np.ndarray): The rows in the score matrix corresponding to each guess
+        cols (np.ndarray): The columns in the score matrix corresponding to each solution
+        num_scores (int): The number of possible scores
+        num_chunks (int): The number of chunks to split the guesses into
+
+    Returns:
+        The rank of the best guess. See _minimax_best_of_range(...) for details.
+    """
+    num_guesses = len(rows)
+    chunk_size = (num_guesses + num_chunks - 1) // num_chunks
+    chunk_bests = np.empty((num_chunks, 4), dtype=np.int64)
+
+    for c in prange(num_chunks):
+        start = min(c * chunk_size, num_guesses)
+        stop = min(start + chunk_size, num_guesses)
+        largest, is_not_potential_soln, negative_num_buckets, i = _minimax_best_of_range(
+            matrix, rows, cols, num_scores, start, stop
+        )
+        chunk_bests[c, 0] = largest
+        chunk_bests[c, 1] = is_not_potential_soln
+        chunk_bests[c, 2] = negative_num_buckets
+        chunk_bests[c, 3] = i
+
+    best = (len(cols) + 1, True, 0, -1)
+    for c in range(num_chunks):
+        candidate = (chunk_bests[c, 0], chunk_bests[c, 1] != 0, chunk_bests[c, 2], chunk_bests[c, 3])
+        if candidate < best:
+            best = candidate
+
+    return best
+
+
 class MemoryMappedStorage:
     def __init__(self, data: np.ndarray) -> None:
         self.shared_memory = self.create_shared_memory_block(data)
@@ -220,9 +471,10 @@ class ScoreMatrix(MemoryMappedStorage):
             lazy_eval (bool, optional): Whether to perform lazy evaluation. Defaults to True.
         """
         rows, cols = all_words.index.max() + 1, potential_solns.index.max() + 1
-        storage = np.full((rows, cols), -1, dtype=int)
+        storage = np.zeros((rows, cols), dtype=scorer.dtype)
 
         self.is_calculated = np.zeros(cols, dtype=bool)
+        self.is_row_calculated = np.zeros(rows, dtype=bool)
         self.is_fully_initialized = False
         super().__init__(storage)
 
@@ -245,11 +497,117 @@ class ScoreMatrix(MemoryMappedStorage):
         if self.is_fully_initialized or np.all(self.is_calculated[solns.index]):
             return
 
-        row_words = self.all_words.words[np.newaxis, :]
-        col_words = solns.words[:, np.newaxis]
+        is_full_precompute = len(solns) == len(self.potential_solns)
+        if is_full_precompute and self._load_from_cache():
+            return
 
-        # TODO investigate performance of np.vectorize
-        func = np.vectorize(self.scorer.score_word)
-        self._storage[:, solns.index] = func(col_words, row_words).T
+        self._storage[:, solns.index] = self.scorer.score_matrix(solns, self.all_words)
         self.is_calculated[solns.index] = True
         self.is_fully_initialized = bool(np.all(self.is_calculated))
+
+        if is_full_precompute:
+            self._save_to_cache()
+
+    def get_scores(self, potential_solns: WordSeries, guess: Word) -> np.ndarray | None:
+        """Gets the scores of a guess against the potential solutions.
+
+        If the relevant columns have not been precomputed, the guess is scored against
+        every solution once and its row is retained so that subsequent calls with the
+        same guess (e.g. from deep searches or later games) are free.
+
+        Args:
+            potential_solns (WordSeries): The potential solutions.
+            guess (Word): The guess.
+
+        Returns:
+            np.ndarray | None:
+                The vector of scores or None if the guess is not in the matrix.
+        """
+        row = self.all_words.find_index(guess)
+        if row < 0:
+            return None
+
+        is_known = self.is_fully_initialized or self.is_row_calculated[row]
+        if not is_known and not np.all(self.is_calculated[potential_solns.index]):
+            self._storage[row, self.potential_solns.index] = self.scorer.score_words(
+                self.potential_solns, guess
+            )
+            self.is_row_calculated[row] = True
+
+        return self._storage[row, potential_solns.index]
+
+    @property
+    def cache_path(self) -> Path | None:
+        """The file in which the fully precomputed matrix is persisted between sessions.
+
+        The file name is a hash of the words and the data type of the scores so that a
+        change to the dictionary never picks up a stale matrix. Only matrices of words of
+        length CACHED_WORD_LENGTH are persisted and only the most recently saved matrix is
+        kept. The directory defaults to ~/.cache/doddle and can be overridden with the
+        DODDLE_CACHE_DIR environment variable. Setting the variable to an empty string
+        disables the cache.
+
+        Returns:
+            Path | None: Returns the path of the cache file or None if caching is disabled.
+        """
+        cache_dir = os.environ.get("DODDLE_CACHE_DIR", str(Path.home() / ".cache" / "doddle"))
+        if not cache_dir or self.scorer.size != CACHED_WORD_LENGTH:
+            return None
+
+        hasher = hashlib.sha256(f"v{SCORE_MATRIX_CACHE_VERSION}|{self.dtype}|".encode())
+        for series in (self.all_words, self.potential_solns):
+            hasher.update(",".join(word.value for word in series).encode())
+            hasher.update(b"|")
+
+        return Path(cache_dir) / f"scores-{self.scorer.size}-{hasher.hexdigest()[:16]}.npy"
+
+    def _load_from_cache(self) -> bool:
+        """Loads the full matrix from the cache, if it has previously been persisted.
+
+        Returns:
+            bool: Returns True if the matrix was loaded.
+        """
+        path = self.cache_path
+        if path is None:
+            return False
+
+        try:
+            cached = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return False
+
+        if cached.shape != self.shape or cached.dtype != self.dtype:
+            return False
+
+        self._storage[:] = cached
+        self.is_calculated[:] = True
+        self.is_fully_initialized = True
+        return True
+
+    def _save_to_cache(self) -> None:
+        """Persists the full matrix to the cache, replacing any matrix persisted before.
+
+        Failing to do so is not an error.
+        """
+        path = self.cache_path
+        if path is None:
+            return
+
+        # Write to a temporary file first so that a concurrent reader never sees a
+        # partially written matrix.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                np.save(file, self._storage)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        try:
+            for stale_path in path.parent.glob(f"scores-{self.scorer.size}-*.npy"):
+                if stale_path != path:
+                    stale_path.unlink(missing_ok=True)
+        except OSError:
+            pass
@@ -1,7 +1,16 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import product
+from typing import Callable
+
 import numpy as np
-from numba import int8, int32, jit  # type: ignore
+from numba import int8, int32, jit, njit, prange  # type: ignore
+
+from .words import ASTERISK, Word, WordSeries
 
-from .words import Word
+# Longer words have too many scores to tabulate, so their scores are converted one at a time.
+MAX_TABULATED_TERNARY_LENGTH = 9
 
 
 class Scorer:
@@ -18,6 +27,17 @@ class Scorer:
         self.size = size
         self._powers = (3 ** np.arange(size - 1, -1, -1)).astype(np.int32)
 
+    @property
+    def dtype(self) -> np.dtype:
+        """The smallest integer type that can hold every score.
+
+        e.g. in a 5 letter game of Wordle, all 243 scores fit in a single byte.
+
+        Returns:
+            np.dtype: Returns the data type of the scores.
+        """
+        return np.min_scalar_type(self.perfect_score)
+
     @property
     def perfect_score(self) -> int:
         """A decimal representation of the perfect ternary score.
@@ -68,80 +88,303 @@ class Scorer:
         Returns:
             int: The score.
         """
-        # return score_word_slow(solution.value, guess.value) # (x50 slower!)
         return _score_word_jit(solution.vector, guess.vector, self._powers)
 
+    def score_words(self, solns: WordSeries, guess: Word) -> np.ndarray:
+        """Scores a guess against every solution in a single call.
 
-@jit(int32(int8[:], int8[:], int32[:]), nopython=True)
-def _score_word_jit(solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray) -> int:
-    """Optimised internal call to score a word. See Solver.score_word(...) for details."""
+        Args:
+            solns (WordSeries): The solutions.
+            guess (Word): The guess.
 
-    matches = solution_array == guess_array
+        Returns:
+            np.ndarray: A vector of scores, one for each solution.
+        """
+        scores = np.empty(len(solns), dtype=self.dtype)
+        if solns.codes is None:
+            score_many_jit, _ = _fixed_length_kernels(self.size)
+            score_many_jit(solns.vectors, guess.vector, self._powers, scores)
+        else:
+            score_many_packed_jit, _ = _fixed_length_packed_kernels(self.size)
+            score_many_packed_jit(solns.codes, guess.vector, self._powers, scores)
+        return scores
+
+    def score_matrix(self, solns: WordSeries, guesses: WordSeries) -> np.ndarray:
+        """Scores every guess against every solution in a single, parallelised pass.
 
-    value = 0
-    for (i, is_match) in enumerate(matches):
-        if is_match:
-            value += 2 * powers[i]
+        Args:
+            solns (WordSeries): The solutions.
+            guesses (WordSeries): The guesses.
 
-    for (i, is_match) in enumerate(matches):
-        if is_match:
-            continue
+        Returns:
+            np.ndarray: A matrix of scores. Rows correspond to guesses, columns to solutions.
+        """
+        matrix = np.empty((len(guesses), len(solns)), dtype=self.dtype)
+        if solns.codes is None or guesses.codes is None:
+            _, score_matrix_jit = _fixed_length_kernels(self.size)
+            score_matrix_jit(guesses.vectors, solns.vectors, self._powers, matrix)
+        else:
+            _, score_matrix_packed_jit = _fixed_length_packed_kernels(self.size)
+            score_matrix_packed_jit(guesses.codes, solns.codes, self._powers, matrix)
+        return matrix
+
+
+@njit(cache=True)
+def _score_word_of_length(
+    solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray, size: int
+) -> int:
+    """Scores a word of the given length.
+
+    Rather than rescanning the word for every unmatched letter, we keep a count of the
+    unmatched letters in the solution. The counts are packed four bits per letter into
+    two 64-bit integers (A-P in lo, Q-Z in hi) so that they live in registers and the
+    scoring is linear in the word length, free of data-dependent branches. An asterisk
+    is counted in slot 26. Any other character shares slot 31, so guesses containing
+    one must be scored by _score_word_by_rescanning(...) instead.
+
+    When the size is a compile-time constant, as it is in the kernels returned by
+    _fixed_length_kernels(...), both loops are fully unrolled.
+    """
 
+    nibble = np.uint64(15)
+    lo = np.uint64(0)
+    hi = np.uint64(0)
+
+    value = 0
+    for i in range(size):
+        letter = solution_array[i]
+        is_match = letter == guess_array[i]
+        value += 2 * powers[i] * is_match
+
+        slot = _slot_of(letter)
+        shift = np.uint64(4 * (slot & 15))
+        is_hi = np.uint64(slot >> 4)
+        increment = np.uint64(not is_match) << shift
+        lo += increment * (np.uint64(1) - is_hi)
+        hi += increment * is_hi
+
+    for i in range(size):
         letter = guess_array[i]
-        num_times_already_observed = 0
-        for j in range(i):
-            if not matches[j]:
-                num_times_already_observed += letter == guess_array[j]
+        slot = _slot_of(letter)
+        shift = np.uint64(4 * (slot & 15))
+        is_hi = np.uint64(slot >> 4)
+        counts = lo * (np.uint64(1) - is_hi) + hi * is_hi
+        is_available = ((counts >> shift) & nibble) > np.uint64(0)
+        is_partial_match = is_available and letter != solution_array[i]
+        value += powers[i] * is_partial_match
+
+        decrement = np.uint64(is_partial_match) << shift
+        lo -= decrement * (np.uint64(1) - is_hi)
+        hi -= decrement * is_hi
+
+    return value
+
+
+@njit(inline="always")
+def _slot_of(letter: int) -> int:
+    """The slot in which a letter is counted: 0-25 for A-Z, 26 for an asterisk and 31 otherwise."""
+    if 0 <= letter < 26:
+        return letter
+    return 26 if letter == ASTERISK else 31
 
-        num_times_in_solution = 0
-        for (j, is_match_j) in enumerate(matches):
-            if is_match_j:
-                continue
-            soln_letter = solution_array[j]
-            num_times_in_solution += int(letter == soln_letter)
 
-        is_partial_match = num_times_already_observed < num_times_in_solution
-        value += int(powers[i] * is_partial_match)
+@njit(inline="always")
+def _has_other_character(guess_array: np.ndarray, size: int) -> bool:
+    """Whether the guess contains a character other than A-Z or an asterisk."""
+    for i in range(size):
+        if _slot_of(guess_array[i]) == 31:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _score_word_by_rescanning(
+    solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray, size: int
+) -> int:
+    """Scores a word of the given length by rescanning the words for every unmatched character."""
+
+    value = 0
+    for i in range(size):
+        if solution_array[i] == guess_array[i]:
+            value += 2 * powers[i]
+            continue
+
+        character = guess_array[i]
+        num_in_solution = 0
+        num_already_observed = 0
+        for j in range(size):
+            if solution_array[j] != guess_array[j]:
+                num_in_solution += solution_array[j] == character
+                num_already_observed += j < i and guess_array[j] == character
+        value += powers[i] * (num_already_observed < num_in_solution)
 
     return value
 
 
-def score_word_slow(soln: str, guess: str) -> int:
-    """
-    This is no longer used but is kept because it is a more
-    readable reference implementation of the above, more
-    optimised code.
+@jit(int32(int8[:], int8[:], int32[:]), nopython=True, cache=True)
+def _score_word_jit(solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray) -> int:
+    """Optimised internal call to score a word. See Solver.score_word(...) for details."""
+    size = len(guess_array)
+    if _has_other_character(guess_array, size):
+        return _score_word_by_rescanning(solution_array, guess_array, powers, size)
+    return _score_word_of_length(solution_array, guess_array, powers, size)
+
+
+@njit(inline="always")
+def _pack_word(vector: np.ndarray, size: int) -> np.uint64:
+    """Packs a word as in WordSeries.codes, except that any other character is packed as 31.
+
+    No packed solution contains code 31, so such a character is never matched. This allows
+    any guess to be scored against packed solutions.
     """
-    size = len(soln)
-    solution_array = np.array(list(soln))
-    guess_array = np.array(list(guess))
+    code = np.uint64(0)
+    for k in range(size):
+        code |= np.uint64(_slot_of(vector[k])) << np.uint64(5 * k)
+    return code
 
-    indices = np.arange(size, 0, -1) - 1
-    powers = 3**indices
 
-    # First we tackle exact matches
-    matches = solution_array == guess_array
-    value = powers[matches].sum() * 2
+@njit(inline="always")
+def _score_packed_word_of_length(
+    solution_code: np.uint64, guess_code: np.uint64, powers: np.ndarray, size: int
+) -> int:
+    """Scores a word of the given length from the packed codes of the solution and guess.
 
-    # Remove exact matches from the search
-    unmatched = ~matches
-    unmatched_powers = powers[unmatched]
-    unmatched_solution = solution_array[unmatched]
-    unmatched_guess = guess_array[unmatched]
+    Every green is found at once: XOR the codes and test each five bit lane for zero
+    without letting a carry cross into the next lane. The letters are then read from
+    the codes with shifts and the yellows are counted as in _score_word_of_length(...).
 
-    partial_matches = unmatched_powers == -1
+    The function is inlined into the kernels that call it so that the word length is
+    known at compile time and the loops unroll.
+    """
 
-    for i in range(len(unmatched_powers)):
-        letter = unmatched_guess[i]
-        num_times_already_observed = np.sum(letter == unmatched_guess[:i])
-        num_times_in_solution = np.sum(letter == unmatched_solution)
-        is_partial_match = num_times_already_observed < num_times_in_solution
-        partial_matches[i] = is_partial_match
+    low_bits = np.uint64(0)
+    high_bits = np.uint64(0)
+    for i in range(size):
+        low_bits |= np.uint64(15) << np.uint64(5 * i)
+        high_bits |= np.uint64(16) << np.uint64(5 * i)
+
+    difference = solution_code ^ guess_code
+    is_lane_nonzero = (difference & low_bits) + low_bits
+    greens = ~(is_lane_nonzero | difference | low_bits) & high_bits
+
+    nibble = np.uint64(15)
+    lo = np.uint64(0)
+    hi = np.uint64(0)
+
+    value = 0
+    for i in range(size):
+        letter = (solution_code >> np.uint64(5 * i)) & np.uint64(31)
+        is_match = (greens >> np.uint64(5 * i + 4)) & np.uint64(1)
+        value += 2 * powers[i] * np.int64(is_match)
+
+        shift = np.uint64(4) * (letter & nibble)
+        is_hi = letter >> np.uint64(4)
+        increment = (np.uint64(1) - is_match) << shift
+        lo += increment * (np.uint64(1) - is_hi)
+        hi += increment * is_hi
+
+    for i in range(size):
+        letter = (guess_code >> np.uint64(5 * i)) & np.uint64(31)
+        is_match = (greens >> np.uint64(5 * i + 4)) & np.uint64(1)
+        shift = np.uint64(4) * (letter & nibble)
+        is_hi = letter >> np.uint64(4)
+        counts = lo * (np.uint64(1) - is_hi) + hi * is_hi
+        is_available = ((counts >> shift) & nibble) > np.uint64(0)
+        is_partial_match = is_available and is_match == np.uint64(0)
+        value += powers[i] * np.int64(is_partial_match)
+
+        decrement = np.uint64(is_partial_match) << shift
+        lo -= decrement * (np.uint64(1) - is_hi)
+        hi -= decrement * is_hi
 
-    value += unmatched_powers[partial_matches].sum()
     return value
 
 
+@lru_cache(maxsize=None)
+def _fixed_length_kernels(size: int) -> tuple[Callable[..., None], Callable[..., None]]:
+    """Builds the batched scoring kernels specialised to a single word length.
+
+    The kernels close over the word length so that Numba compiles it as a constant
+    and LLVM can unroll the scoring loops into straight-line code. Only the integer
+    length is captured, which keeps the kernels cacheable on disk.
+
+    Args:
+        size (int): The word length.
+
+    Returns:
+        tuple[Callable[..., None], Callable[..., None]]:
+            A kernel that scores a guess against many solutions and a kernel that
+            scores many guesses against many solutions.
+    """
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_many_jit(
+        soln_vectors: np.ndarray, guess_vector: np.ndarray, powers: np.ndarray, scores: np.ndarray
+    ) -> None:
+        """Scores a single guess against every solution without leaving compiled code."""
+        if _has_other_character(guess_vector, size):
+            for j in prange(soln_vectors.shape[0]):
+                scores[j] = _score_word_by_rescanning(soln_vectors[j], guess_vector, powers, size)
+        else:
+            for j in prange(soln_vectors.shape[0]):
+                scores[j] = _score_word_of_length(soln_vectors[j], guess_vector, powers, size)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_matrix_jit(
+        guess_vectors: np.ndarray, soln_vectors: np.ndarray, powers: np.ndarray, matrix: np.ndarray
+    ) -> None:
+        """Scores every guess (rows) against every solution (columns) across all cores."""
+        num_guesses, num_solns = guess_vectors.shape[0], soln_vectors.shape[0]
+        for i in prange(num_guesses):
+            if _has_other_character(guess_vectors[i], size):
+                for j in range(num_solns):
+                    matrix[i, j] = _score_word_by_rescanning(
+                        soln_vectors[j], guess_vectors[i], powers, size
+                    )
+            else:
+                for j in range(num_solns):
+                    matrix[i, j] = _score_word_of_length(soln_vectors[j], guess_vectors[i], powers, size)
+
+    return _score_many_jit, _score_matrix_jit
+
+
+@lru_cache(maxsize=None)
+def _fixed_length_packed_kernels(size: int) -> tuple[Callable[..., None], Callable[..., None]]:
+    """Builds the batched scoring kernels for packed words of a single word length.
+
+    As in _fixed_length_kernels(...), but the solutions are scored from their packed
+    codes. See WordSeries.codes for details.
+
+    Args:
+        size (int): The word length.
+
+    Returns:
+        tuple[Callable[..., None], Callable[..., None]]:
+            A kernel that scores a guess against many solutions and a kernel that
+            scores many guesses against many solutions.
+    """
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_many_packed_jit(
+        soln_codes: np.ndarray, guess_vector: np.ndarray, powers: np.ndarray, scores: np.ndarray
+    ) -> None:
+        """Scores a single guess against the packed code of every solution."""
+        guess_code = _pack_word(guess_vector, size)
+        for j in prange(soln_codes.shape[0]):
+            scores[j] = _score_packed_word_of_length(soln_codes[j], guess_code, powers, size)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_matrix_packed_jit(
+        guess_codes: np.ndarray, soln_codes: np.ndarray, powers: np.ndarray, matrix: np.ndarray
+    ) -> None:
+        """Scores every packed guess (rows) against every packed solution (columns) across all cores."""
+        for i in prange(guess_codes.shape[0]):
+            for j in range(soln_codes.shape[0]):
+                matrix[i, j] = _score_packed_word_of_length(soln_codes[j], guess_codes[i], powers, size)
+
+    return _score_many_packed_jit, _score_matrix_packed_jit
+
+
 def from_ternary(ternary: str) -> int:
     """Converts a ternary number to its decimal (base 10) equivalent.
 
@@ -168,4 +411,19 @@ def to_ternary(score: int, size: int) -> str:
     Returns:
         str: The ternary score.
     """
-    return np.base_repr(score, base=3).zfill(size)
+    if size > MAX_TABULATED_TERNARY_LENGTH:
+        return np.base_repr(score, 3).zfill(size)
+    return _ternaries(size)[score]
+
+
+@lru_cache(maxsize=None)
+def _ternaries(size: int) -> tuple[str, ...]:
+    """Every ternary score for a given word length, indexed by its decimal value.
+
+    Args:
+        size (int): The word length.
+
+    Returns:
+        tuple[str, ...]: The ternary scores.
+    """
+    return tuple("".join(digits) for digits in product("012", repeat=size))
@@ -8,6 +8,7 @@ import numpy as np
 from .game import Game, SimultaneousGame
 from .guess import EntropyGuess, Guess, MinimaxGuess, MinimaxSimulGuess
 from .histogram import HistogramBuilder, to_histogram
+from .solver import SEED_BY_SIZE
 from .words import Word, WordSeries
 
 TSingleGuess = TypeVar("TSingleGuess", bound=Guess, covariant=True)
@@ -53,14 +54,8 @@ class SimulSolver(Generic[TSingleGuess, TSimulGuess], abc.ABC):
     def to_simul_guess(self, games: list[Game], single_guesses: tuple[TSingleGuess]) -> TSimulGuess:
         ...  # pragma: no cover
 
-    @property
-    @abc.abstractmethod
-    def all_seeds(self) -> list[Word]:
-        ...  # pragma: no cover
-
     def seed(self, size: int) -> Word:
-        seed_by_size = {len(word): word for word in self.all_seeds}
-        return seed_by_size[size]
+        return SEED_BY_SIZE[size]
 
 
 class MinimaxSimulSolver(SimulSolver[MinimaxGuess, MinimaxSimulGuess]):
@@ -86,11 +81,6 @@ class MinimaxSimulSolver(SimulSolver[MinimaxGuess, MinimaxSimulGuess]):
 
         return MinimaxSimulGuess(word, is_potential_soln, pct_left, min, tot, max, num_buckets)
 
-    @property
-    def all_seeds(self) -> list[Word]:
-        seeds = {"OLEA", "RAISE", "TAILER", "TENAILS", "CENTRALS", "SECRETION"}
-        return [Word(seed) for seed in seeds]
-
 
 class EntropySimulSolver(SimulSolver[EntropyGuess, EntropyGuess]):
     def __init__(self, histogram_builder: HistogramBuilder) -> None:
@@ -108,8 +98,3 @@ class EntropySimulSolver(SimulSolver[EntropyGuess, EntropyGuess]):
         is_perfect_partition = all(g.is_perfect_partition for g in guess_tuple)
 
         return EntropyGuess(word, is_potential_soln, total_entropy, is_perfect_partition)
-
-    @property
-    def all_seeds(self) -> list[Word]:
-        seeds = {"OLEA", "RAISE", "TAILER", "TENAILS", "CENTRALS", "SECRETION"}
-        return [Word(seed) for seed in seeds]
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import abc
-from typing import Generic, Iterator, TypeVar
+from typing import Final, Generic, Iterator, TypeVar
 
 import numpy as np
 
-from .guess import EntropyGuess, Guess, MinimaxGuess
+from .guess import ENTROPY_TOLERANCE, EntropyGuess, Guess, MinimaxGuess
 from .histogram import HistogramBuilder, to_histogram
 from .words import Word, WordSeries
 
 TGuess_co = TypeVar("TGuess_co", bound=Guess, covariant=True)
 
+# The precomputed opening guess for each word length from 4 to 9.
+SEED_BY_SIZE: Final[dict[int, Word]] = {
+    len(seed): Word(seed) for seed in ("OLEA", "RAISE", "TAILER", "TENAILS", "CENTRALS", "SECRETION")
+}
+
 
 class Solver(Generic[TGuess_co], abc.ABC):
     def __init__(self, hist_builder: HistogramBuilder) -> None:
@@ -50,6 +55,21 @@ class Solver(Generic[TGuess_co], abc.ABC):
         """
         yield from self.hist_builder.stream(all_words, potential_solns, self._build_guess)
 
+    def best_guesses(
+        self, all_words: WordSeries, potential_solns: WordSeries, n: int
+    ) -> list[TGuess_co]:
+        """Gets the n best guesses, best first.
+
+        Args:
+            all_words (WordSeries): The full universe of words.
+            potential_solns (WordSeries): The words that still remain as potential solutions.
+            n (int): The number of guesses.
+
+        Returns:
+            list[TGuess]: The best guesses.
+        """
+        return sorted(self.all_guesses(all_words, potential_solns))[:n]
+
     @abc.abstractmethod
     def _build_guess(self, word: Word, is_potential_soln: bool, histogram: np.ndarray) -> TGuess_co:
         """Factory method for building a guess from a histogram
@@ -64,16 +84,6 @@ class Solver(Generic[TGuess_co], abc.ABC):
         """
         ...  # pragma: no cover
 
-    @property
-    @abc.abstractmethod
-    def all_seeds(self) -> list[Word]:
-        """Returns a list of all seeds for words of length 4-9.
-
-        Returns:
-          list[Word]: The list of all seeds.
-        """
-        ...  # pragma: no cover
-
     def seed(self, size: int) -> Word:
         """Gets the optimal starting word to use for a given solver
         implementation. This is for efficiency purposes - there's no
@@ -86,19 +96,54 @@ class Solver(Generic[TGuess_co], abc.ABC):
         Returns:
           Word: The seed.
         """
-        seed_by_size = {len(word): word for word in self.all_seeds}
-        return seed_by_size[size]
+        return SEED_BY_SIZE[size]
 
 
 class MinimaxSolver(Solver[MinimaxGuess]):
     def __init__(self, histogram_builder: HistogramBuilder) -> None:
         super().__init__(histogram_builder)
 
-    @property
-    def all_seeds(self) -> list[Word]:
+    def get_best_guess(self, all_words: WordSeries, potential_solns: WordSeries) -> MinimaxGuess:
+        """See base class."""
+        if len(potential_solns) <= 2:
+            return super().get_best_guess(all_words, potential_solns)
+
+        best = self.hist_builder.minimax_best(all_words, potential_solns)
+        i, largest, num_buckets, is_potential_soln = best
+        return MinimaxGuess(all_words.words[i], is_potential_soln, num_buckets, largest)
+
+    def all_guesses(self, all_words: WordSeries, potential_solns: WordSeries) -> Iterator[MinimaxGuess]:
         """See base class."""
-        seeds = ["OLEA", "RAISE", "TAILER", "TENAILS", "CENTRALS", "SECRETION"]
-        return [Word(seed) for seed in seeds]
+        stats = self.hist_builder.evaluate_all_guesses(all_words, potential_solns)
+        for i in range(len(all_words)):
+            yield self._guess_from_stats(all_words, stats, i)
+
+    def best_guesses(
+        self, all_words: WordSeries, potential_solns: WordSeries, n: int
+    ) -> list[MinimaxGuess]:
+        """See base class."""
+        stats = self.hist_builder.evaluate_all_guesses(all_words, potential_solns)
+
+        # The words are in alphabetical order so, as lexsort is stable, sorting by the
+        # remaining keys of MinimaxGuess.sort_key(...) yields the same ordering.
+        order = np.lexsort((-stats["num_buckets"], ~stats["is_potential_soln"], stats["largest"]))
+        return [self._guess_from_stats(all_words, stats, i) for i in order[:n]]
+
+    @staticmethod
+    def _guess_from_stats(all_words: WordSeries, stats: np.ndarray, i: int) -> MinimaxGuess:
+        """Builds the ith guess from the vectorised guess statistics.
+
+        Args:
+            all_words (WordSeries): The full universe of words.
+            stats (np.ndarray): The guess statistics.
+            i (int): The position of the guess in all_words.
+
+        Returns:
+            MinimaxGuess: The minimax guess.
+        """
+        largest, num_buckets, is_potential_soln, _ = stats[i]
+        word = all_words.words[i]
+        return MinimaxGuess(word, bool(is_potential_soln), int(num_buckets), int(largest))
 
     def _build_guess(self, word: Word, is_potential_soln: bool, histogram: np.ndarray) -> MinimaxGuess:
         """See base class."""
@@ -119,37 +164,81 @@ class DeepMinimaxSolver(MinimaxSolver):
         if len(potential_solns) <= 2:
             return super().get_best_guess(all_words, potential_solns)
 
-        guesses = self.all_guesses(all_words, potential_solns)
-        best_guesses = sorted(guesses)[:N_GUESSES]
+        best_guesses = self.best_guesses(all_words, potential_solns, N_GUESSES)
 
         combined_guesses: list[MinimaxGuess] = []
         for guess in best_guesses:
             if guess.perfectly_partitions():
                 return MinimaxGuess(guess.word, guess.is_potential_soln, 0, 0)
 
-            solns_by_score = self.hist_builder.get_solns_by_score(potential_solns, guess.word)
-            worst_scores = sorted(solns_by_score, key=lambda s: -len(solns_by_score[s]))
+            # Only the largest N_BRANCHES buckets are explored so there's no need to
+            # partition every solution. Ties are broken by score as a stable sort.
+            scores = self.hist_builder.get_scores(potential_solns, guess.word)
+            counts = np.bincount(scores, minlength=self.hist_builder.scorer.perfect_score + 1)
+            worst_scores = np.argsort(-counts, kind="stable")[:N_BRANCHES]
             best_deep_guesses: list[MinimaxGuess] = []
-            for worst_score in worst_scores[:N_BRANCHES]:
-                potential_deep_solns = solns_by_score[worst_score]
+            for worst_score in worst_scores[counts[worst_scores] > 0]:
+                potential_deep_solns = potential_solns[scores == worst_score]
                 deep_guess = self.inner.get_best_guess(all_words, potential_deep_solns)
                 best_deep_guesses.append(deep_guess)
-            worst_best_deep_guess = max(best_deep_guesses)
+            worst_best_deep_guess = max(best_deep_guesses, key=MinimaxGuess.sort_key)
             combined_guess = guess >> worst_best_deep_guess
             combined_guesses.append(combined_guess)
 
-        return min(combined_guesses)
+        return min(combined_guesses, key=MinimaxGuess.sort_key)
 
 
 class EntropySolver(Solver[EntropyGuess]):
     def __init__(self, histogram_builder: HistogramBuilder) -> None:
         super().__init__(histogram_builder)
 
-    @property
-    def all_seeds(self) -> list[Word]:
+    def get_best_guess(self, all_words: WordSeries, potential_solns: WordSeries) -> EntropyGuess:
         """See base class."""
-        seeds = ["OLEA", "RAISE", "TAILER", "TENAILS", "CENTRALS", "SECRETION"]
-        return [Word(seed) for seed in seeds]
+        if len(potential_solns) <= 2:
+            return super().get_best_guess(all_words, potential_solns)
+
+        return self.best_guesses(all_words, potential_solns, 1)[0]
+
+    def all_guesses(self, all_words: WordSeries, potential_solns: WordSeries) -> Iterator[EntropyGuess]:
+        """See base class."""
+        stats = self.hist_builder.evaluate_all_guesses(all_words, potential_solns)
+        for i in range(len(all_words)):
+            yield self._guess_from_stats(all_words, potential_solns, stats, i)
+
+    def best_guesses(
+        self, all_words: WordSeries, potential_solns: WordSeries, n: int
+    ) -> list[EntropyGuess]:
+        """See base class."""
+        stats = self.hist_builder.evaluate_all_guesses(all_words, potential_solns)
+
+        # Entropies within a tolerance of one another are ranked by the remaining
+        # criteria of EntropyGuess so every guess that could tie with the nth best
+        # entropy is a candidate. Only the candidates are built and compared.
+        entropy = stats["entropy"]
+        nth_best_entropy = np.sort(entropy)[::-1][min(n, len(entropy)) - 1]
+        candidates = np.flatnonzero(entropy >= nth_best_entropy - ENTROPY_TOLERANCE)
+        guesses = [self._guess_from_stats(all_words, potential_solns, stats, i) for i in candidates]
+        return sorted(guesses)[:n]
+
+    @staticmethod
+    def _guess_from_stats(
+        all_words: WordSeries, potential_solns: WordSeries, stats: np.ndarray, i: int
+    ) -> EntropyGuess:
+        """Builds the ith guess from the vectorised guess statistics.
+
+        Args:
+            all_words (WordSeries): The full universe of words.
+            potential_solns (WordSeries): The words that still remain as potential solutions.
+            stats (np.ndarray): The guess statistics.
+            i (int): The position of the guess in all_words.
+
+        Returns:
+            EntropyGuess: The entropy guess.
+        """
+        _, num_buckets, is_potential_soln, entropy = stats[i]
+        word = all_words.words[i]
+        is_perfect_partition = num_buckets == len(potential_solns)
+        return EntropyGuess(word, bool(is_potential_soln), float(entropy), bool(is_perfect_partition))
 
     def _build_guess(self, word: Word, is_potential_soln: bool, histogram: np.ndarray) -> EntropyGuess:
         """See base class."""
@@ -169,8 +258,7 @@ class DeepEntropySolver(EntropySolver):
         if len(potential_solns) <= 2:
             return super().get_best_guess(all_words, potential_solns)
 
-        guesses = self.all_guesses(all_words, potential_solns)
-        best_guesses = sorted(guesses)[:N_GUESSES]
+        best_guesses = self.best_guesses(all_words, potential_solns, N_GUESSES)
 
         combined_guesses: list[EntropyGuess] = []
         for guess in best_guesses:
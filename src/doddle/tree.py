@@ -47,15 +47,14 @@ class TreeBuilder:
                 score_node.add(soln0).add(score1).add(soln1).add(WIN_SCORE)
                 continue
 
-            guesses = self.solver.all_guesses(self.dictionary.all_words, inner_solns)
-            best_guesses = sorted(guesses)[:N_GUESSES]
+            best_guesses = self.solver.best_guesses(self.dictionary.all_words, inner_solns, N_GUESSES)
             naive_best_guess = best_guesses[0]
 
             if naive_best_guess.is_perfect_partition:
                 guess_node = score_node.add(naive_best_guess.word)
-                for soln in inner_solns:
-                    score = self.scorer.score_word(soln, naive_best_guess.word)
-                    score_node = guess_node.add(score)
+                scores = self.histogram_builder.get_scores(inner_solns, naive_best_guess.word)
+                for soln, score in zip(inner_solns, scores):
+                    score_node = guess_node.add(int(score))
                     if score != WIN_SCORE:
                         score_node.add(soln).add(WIN_SCORE)
                 continue
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import json
-from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, Sequence, cast
+from typing import Iterable, Iterator, Sequence
 
 import numpy as np
 
+# Words of up to this length are also packed five bits per letter into a single 64-bit integer
+MAX_PACKED_WORD_LENGTH = 12
+
+# The dictionaries hold a word of asterisks. An asterisk is counted as a letter of its own.
+ASTERISK = ord("*") - ord("A")
+
 
 class Word:
     """Represents a word within the game.
@@ -88,7 +94,13 @@ class Word:
 
 
 class WordSeries:
-    def __init__(self, words: Iterable[str] | np.ndarray, index: np.ndarray | None = None) -> None:
+    def __init__(
+        self,
+        words: Iterable[str] | np.ndarray,
+        index: np.ndarray | None = None,
+        vectors: np.ndarray | None = None,
+        codes: np.ndarray | None = None,
+    ) -> None:
         """Initialises a new instance of the WordSeries object.
 
         Args:
@@ -97,6 +109,14 @@ class WordSeries:
 
           index (np.ndarray | None, optional):
             The numerical index associated with each word. Defaults to None.
+
+          vectors (np.ndarray | None, optional):
+            The integer vector representation of each word, one row per word.
+            Computed from the words if not provided. Defaults to None.
+
+          codes (np.ndarray | None, optional):
+            The packed code of each word. Computed from the vectors if not
+            provided. Defaults to None.
         """
 
         if isinstance(words, np.ndarray) and words.dtype == type(Word):
@@ -106,6 +126,9 @@ class WordSeries:
             self.words = np.array([Word(w) for w in sorted_words])
 
         self.index = np.arange(len(sorted_words)) if index is None else index
+        self.vectors = WordSeries._to_vectors(self.words) if vectors is None else vectors
+        self.codes = WordSeries._to_codes(self.vectors) if codes is None else codes
+        self._values: np.ndarray | None = None
 
     @property
     def word_length(self) -> int:
@@ -116,6 +139,19 @@ class WordSeries:
         """
         return 0 if len(self) == 0 else len(self.words[0])
 
+    @property
+    def values(self) -> np.ndarray:
+        """The words as a sorted array of fixed-width strings.
+
+        Built on first use and retained so that lookups can be vectorised.
+
+        Returns:
+            np.ndarray: Returns the string value of each word in the series.
+        """
+        if self._values is None:
+            self._values = np.array([word.value for word in self.words], dtype=f"<U{self.word_length}")
+        return self._values
+
     def __contains__(self, value: str | Word) -> bool:
         """Whether the series contains the word
 
@@ -137,16 +173,19 @@ class WordSeries:
             int | np.ndarray: The index or array of indices.
         """
         if isinstance(word, np.ndarray):
-            find_func = np.vectorize(self.__find_index)
-            return find_func(word)
+            keys = np.char.upper(word.astype(str))
+            if len(self) == 0:
+                return np.full(keys.shape, -1)
+            positions = np.searchsorted(self.values, keys)
+            is_found = self.values[np.minimum(positions, len(self) - 1)] == keys
+            return np.where(is_found, positions, -1)
 
         return self.__find_index(word)
 
     def __find_index(self, value: str | Word) -> int:
-        word = Word(value)
-        words = cast(Sequence[Word], self.words)
-        pos = bisect_left(words, word)
-        if pos < len(self) and words[pos] == word:
+        key = str(value).upper()
+        pos = int(np.searchsorted(self.values, key))
+        if pos < len(self) and self.values[pos] == key:
             return pos
         return -1
 
@@ -160,7 +199,9 @@ class WordSeries:
         if can_index:
             sliced_words = self.words[s]
             sliced_index = self.index[s]
-            return WordSeries(sliced_words, sliced_index)
+            sliced_vectors = self.vectors[s]
+            sliced_codes = None if self.codes is None else self.codes[s]
+            return WordSeries(sliced_words, sliced_index, sliced_vectors, sliced_codes)
 
         message = (
             "Indexer must be a slice or logical array. "
@@ -197,6 +238,59 @@ class WordSeries:
     def iloc(self) -> _iLocIndexer:
         return _iLocIndexer(self)
 
+    @staticmethod
+    def _to_vectors(words: np.ndarray) -> np.ndarray:
+        """Builds the vector representation of every word as one contiguous matrix.
+
+        Rather than stacking each word's vector, the words are joined and converted
+        in a single pass over one buffer. Equivalent to stacking Word.to_vector(...).
+
+        Args:
+            words (np.ndarray): The words.
+
+        Returns:
+            np.ndarray: A matrix with one row per word.
+
+        Raises:
+            ValueError: If the words are not all the same length.
+        """
+        if len(words) == 0:
+            return np.zeros((0, 0), dtype=np.int8)
+
+        # Each word is followed by a newline. The words are all the same length exactly when
+        # the buffer splits into equal rows that each end in a newline.
+        values = [word.value for word in words]
+        joined = ("\n".join(values) + "\n").encode("ascii")
+        width = len(values[0]) + 1
+        buffer = np.frombuffer(joined, dtype=np.int8)
+        if len(buffer) != len(values) * width or (buffer[width - 1 :: width] != ord("\n")).any():
+            raise ValueError("Every word in a series must be the same length.")
+
+        asciis = buffer.reshape(len(values), width)[:, :-1]
+        return asciis - np.int8(ord("A"))
+
+    @staticmethod
+    def _to_codes(vectors: np.ndarray) -> np.ndarray | None:
+        """Packs every word into a 64-bit integer, five bits per letter with the first letter lowest.
+
+        The letters A-Z are packed as 0-25 and an asterisk as 26. Words containing any other
+        character cannot be packed and nor can words longer than MAX_PACKED_WORD_LENGTH.
+
+        Args:
+            vectors (np.ndarray): The vector representation of each word, one row per word.
+
+        Returns:
+            np.ndarray | None: The packed code of each word or None if any word cannot be packed.
+        """
+        is_asterisk = vectors == ASTERISK
+        is_packable = ((vectors >= 0) & (vectors < 26)) | is_asterisk
+        if vectors.shape[1] > MAX_PACKED_WORD_LENGTH or not np.all(is_packable):
+            return None
+
+        slots = np.where(is_asterisk, 26, vectors).astype(np.uint64)
+        shifts = np.arange(vectors.shape[1], dtype=np.uint64) * np.uint64(5)
+        return np.bitwise_or.reduce(slots << shifts, axis=1)
+
 
 class _iLocIndexer:
     def __init__(self, series: WordSeries) -> None:
@@ -259,6 +353,25 @@ def load_dictionary(size, extras: Sequence[Word] | None = None) -> Dictionary:
         Dictionary: Returns the dictionary.
     """
 
+    extras_str = frozenset(str(word) for word in extras if word) if extras else frozenset()
+    all_series, common_series = _load_word_series(size, extras_str)
+    return Dictionary(all_series, common_series)
+
+
+@lru_cache(maxsize=8)
+def _load_word_series(size: int, extras: frozenset[str]) -> tuple[WordSeries, WordSeries]:
+    """Loads all words and common words once per process for each word length and set of extras.
+
+    Building a series is dominated by constructing its Words. Series are never modified in
+    place, so every Dictionary loaded with the same arguments can safely share them.
+
+    Args:
+        size (int): The word length.
+        extras (frozenset[str]): Additional words to include in the dictionary.
+
+    Returns:
+        tuple[WordSeries, WordSeries]: Returns all words and common words.
+    """
     if size == 5:
         # Use the official Wordle list for the real game
         all_words = _load_from_file("dictionary-full-official.json", size)
@@ -269,13 +382,10 @@ def load_dictionary(size, extras: Sequence[Word] | None = None) -> Dictionary:
 
     # Add any extra words in case they're missing from the official dictionary
     # Better to solve an unofficial word than bomb out later.
-    extras_str = [str(word) for word in extras if word] if extras else []
-    common_words.update(extras_str)
+    common_words.update(extras)
     all_words.update(common_words)
 
-    common_series = WordSeries(common_words)
-    all_series = WordSeries(all_words)
-    return Dictionary(all_series, common_series)
+    return WordSeries(all_words), WordSeries(common_words)
 
 
 def _load_from_file(file_name: str, size: int) -> set[str]:
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def score_matrix_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Persists any score matrices built by a test to a temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("DODDLE_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -220,6 +220,46 @@ class TestBenchmarker:
         assert benchmark.num_games() == len(solns)
         assert all(scoreboard.rows[-1].score == "22222" for scoreboard in benchmark.scoreboards)
 
+    @patch.object(factory, "load_dictionary")
+    def test_worker_runs_game_with_initialised_engine(
+        self, patch_load_dictionary: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setattr(benchmarking, "_worker_engine", None)
+        patch_load_dictionary.return_value = load_test_dictionary()
+        engine = factory.create_benchmarker(5).engine
+        soln = Word("SNAKE")
+
+        # Act
+        benchmarking._init_worker(engine)
+        game = benchmarking._run_game(soln, [])
+
+        # Assert
+        assert game.is_solved
+        assert game.scoreboard.rows[-1].guess == soln
+
+    @pytest.mark.parametrize(
+        "layer,expected_start_method",
+        [("tbb", "spawn"), ("omp", None), (ValueError("Threading layer is not initialized."), None)],
+    )
+    @patch.object(benchmarking, "threading_layer")
+    def test_executor_only_spawns_workers_with_tbb(
+        self, patch_threading_layer: MagicMock, layer: str | Exception, expected_start_method: str | None
+    ) -> None:
+        # Arrange
+        patch_threading_layer.side_effect = [layer]
+        engine = MagicMock()
+
+        # Act
+        with patch.object(benchmarking, "ProcessPoolExecutor") as patch_executor:
+            benchmarking._create_executor(engine)
+
+        # Assert
+        context = patch_executor.call_args.kwargs["mp_context"]
+        start_method = None if context is None else context.get_start_method()
+        assert start_method == expected_start_method
+        assert patch_executor.call_args.kwargs["initargs"] == (engine,)
+
 
 class TestSimulBenchmarker:
     @patch.object(factory, "load_dictionary")
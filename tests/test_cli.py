@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from sys import argv
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from doddle import cli
 from doddle.controllers import HideController, SolveController
 from doddle.enums import SolverType
@@ -28,11 +32,53 @@ class TestMain:
 
         # Assert
         patch_create_models.assert_called_once_with(
-            expected_size, solver_type=expected_solver_type, depth=expected_depth, extras=expected_extras
+            expected_size,
+            solver_type=expected_solver_type,
+            depth=expected_depth,
+            extras=expected_extras,
+            lazy_eval=False,
         )
 
         patch_solve.assert_called_once_with(expected_guess)
 
+    @pytest.mark.parametrize("run_args", [["solve", "--guess=SALET"], ["solve", "--size=6"]])
+    @patch.object(SolveController, "solve")
+    @patch.object(cli, "create_models")
+    def test_cli_with_solve_is_lazy_unless_the_matrix_can_be_cached(
+        self, patch_create_models: MagicMock, patch_solve: MagicMock, run_args: list[str]
+    ) -> None:
+        # Arrange
+        return_values = (MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        patch_create_models.return_value = return_values
+
+        # Act
+        cli.parse_args(run_args)
+
+        # Assert
+        assert patch_create_models.call_args.kwargs["lazy_eval"]
+
+    @pytest.mark.parametrize("depth,expected_speculate", [(1, 32), (2, 0)])
+    @patch.object(cli, "SolveController")
+    @patch.object(cli, "create_models")
+    def test_cli_with_solve_only_speculates_one_move_deep(
+        self,
+        patch_create_models: MagicMock,
+        patch_solve_controller: MagicMock,
+        depth: int,
+        expected_speculate: int,
+    ) -> None:
+        # Arrange
+        run_args = ["solve", f"--depth={depth}"]
+        return_values = (MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        patch_create_models.return_value = return_values
+
+        # Act
+        cli.parse_args(run_args)
+
+        # Assert
+        speculate = patch_solve_controller.call_args.args[-1]
+        assert speculate == expected_speculate
+
     @patch.object(HideController, "hide")
     @patch.object(cli, "create_models")
     def test_cli_with_hide(self, patch_create_models: MagicMock, patch_hide: MagicMock) -> None:
@@ -73,7 +119,11 @@ class TestMain:
 
         # Assert
         patch_create_engine.assert_called_once_with(
-            expected_size, solver_type=expected_solver_type, depth=expected_depth, extras=expected_extras
+            expected_size,
+            solver_type=expected_solver_type,
+            depth=expected_depth,
+            extras=expected_extras,
+            lazy_eval=False,
         )
 
         mock_engine.run.assert_called_once_with(expected_word, [])
@@ -105,7 +155,11 @@ class TestMain:
 
         # Assert
         patch_create_simul_engine.assert_called_once_with(
-            expected_size, solver_type=expected_solver_type, depth=expected_depth, extras=expected_extras
+            expected_size,
+            solver_type=expected_solver_type,
+            depth=expected_depth,
+            extras=expected_extras,
+            lazy_eval=False,
         )
 
         mock_engine.run.assert_called_once_with(expected_solutions, expected_guesses)
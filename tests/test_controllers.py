@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import time
+from threading import Event
 from unittest.mock import patch
 
+import pytest
+
 from doddle.controllers import HideController, SolveController
 from doddle.guess import MinimaxGuess
 from doddle.histogram import HistogramBuilder
 from doddle.scoring import Scorer, from_ternary
-from doddle.solver import MinimaxSolver
+from doddle.solver import EntropySolver, MinimaxSolver
 from doddle.views import HideView, SolveView
 from doddle.words import Word
 
@@ -82,6 +86,85 @@ class TestSolveController:
         # Assert
         assert not is_solved
 
+    @pytest.mark.parametrize("solver_type", [MinimaxSolver, EntropySolver])
+    @patch.object(SolveView, "report_best_guess")
+    @patch.object(SolveView, "get_user_score")
+    def test_speculative_solve_reports_same_guesses(
+        self, mock_get_user_score, mock_report_best_guess, solver_type: type
+    ) -> None:
+
+        # Arrange
+        size = 5
+        soln = Word("MONTH")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = solver_type(histogram_builder)
+        view = SolveView(size)
+
+        mock_get_user_score.side_effect = lambda guess: (scorer.score_word(soln, guess), guess)
+
+        sut = SolveController(dictionary, scorer, histogram_builder, solver, view)
+        speculative_sut = SolveController(
+            dictionary, scorer, histogram_builder, solver, view, speculate=243
+        )
+
+        # Act
+        sut.solve(None)
+        expected = [c.args[0] for c in mock_report_best_guess.call_args_list]
+        mock_report_best_guess.reset_mock()
+
+        with patch.object(solver, "get_best_guess", wraps=solver.get_best_guess) as spy_get_best_guess:
+            is_solved = speculative_sut.solve(None)
+        actual = [c.args[0] for c in mock_report_best_guess.call_args_list]
+
+        # Assert
+        assert is_solved
+        assert actual == expected
+        assert actual[-1] == soln
+        assert spy_get_best_guess.call_count > len(actual)
+
+    @patch.object(SolveView, "report_success")
+    @patch.object(SolveView, "get_user_score")
+    @patch.object(MinimaxSolver, "get_best_guess")
+    def test_speculative_solve_waits_for_running_guess(
+        self, mock_get_best_guess, mock_get_user_score, mock_report_success
+    ) -> None:
+
+        # Arrange
+        size = 5
+        guess = Word("MONTH")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = MinimaxSolver(histogram_builder)
+        view = SolveView(size)
+        has_started = Event()
+        has_finished = Event()
+        has_finished_by_success: list[bool] = []
+
+        def get_best_guess(*_) -> None:
+            has_started.set()
+            time.sleep(0.1)
+            has_finished.set()
+
+        def get_user_score(*_) -> tuple[int, Word]:
+            has_started.wait(timeout=10)
+            return (scorer.perfect_score, guess)
+
+        mock_get_best_guess.side_effect = get_best_guess
+        mock_get_user_score.side_effect = get_user_score
+        mock_report_success.side_effect = lambda: has_finished_by_success.append(has_finished.is_set())
+        sut = SolveController(dictionary, scorer, histogram_builder, solver, view, speculate=4)
+
+        # Act
+        is_solved = sut.solve(guess)
+
+        # Assert
+        assert is_solved
+        assert has_finished_by_success == [True]
+        assert mock_get_best_guess.call_count == 1
+
 
 class TestHideController:
     @patch.object(HideView, "get_user_guess")
@@ -109,3 +192,31 @@ class TestHideController:
 
         # Assert
         mock_get_user_guess.assert_called()
+
+    @patch.object(HideView, "update")
+    @patch.object(HideView, "get_user_guess")
+    def test_hide_keeps_largest_bucket(self, mock_get_user_guess, mock_update) -> None:
+
+        # Arrange
+        size = 5
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        view = HideView(size)
+
+        guess = Word("SNAKE")
+        histogram = histogram_builder.get_solns_by_score(dictionary.common_words, guess)
+        expected_score = max(histogram, key=lambda score: len(histogram[score]))
+
+        # Mocking
+        mock_get_user_guess.side_effect = [guess, Word("MOUNT"), Word("CHILD"), Word("VIVID")]
+
+        sut = HideController(dictionary, scorer, histogram_builder, view)
+
+        # Act
+        sut.hide(None)
+
+        # Assert
+        _, _, actual_score, actual_answers = mock_update.call_args_list[0].args
+        assert actual_score == expected_score
+        assert list(actual_answers) == list(histogram[expected_score])
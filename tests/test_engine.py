@@ -60,6 +60,33 @@ class TestEngine:
         with pytest.raises(FailedToFindASolutionError):
             sut.run(soln, [Word("STOLE")])
 
+    @patch.object(EntropySolver, "get_best_guess")
+    def test_engine_reuses_best_guess_for_repeated_positions(self, mock_get_best_guess) -> None:
+        # Arrange
+        size = 5
+        soln = Word("FUNKY")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = EntropySolver(histogram_builder)
+        reporter = RunReporter()
+        sut = Engine(dictionary, scorer, histogram_builder, solver, reporter)
+
+        mock_get_best_guess.side_effect = [
+            EntropyGuess(Word("MULCH"), False, 5, False),
+            EntropyGuess(Word("FANGO"), False, 5, True),
+            EntropyGuess(soln, True, 5, True),
+        ]
+
+        # Act
+        game1 = sut.run(soln, [])
+        game2 = sut.run(soln, [])
+
+        # Assert
+        assert mock_get_best_guess.call_count == 3
+        assert game1.is_solved and game2.is_solved
+        assert [row.guess for row in game1.scoreboard] == [row.guess for row in game2.scoreboard]
+
 
 class TestSimulEngine:
     @patch.object(MinimaxSimulSolver, "get_best_guess")
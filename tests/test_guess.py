@@ -65,6 +65,25 @@ class TestMinimaxGuess:
         assert not is_better
         assert is_worse
 
+    def test_minimax_guess_sort_key_orders_like_comparison(self) -> None:
+        # Arrange
+        guesses = [
+            MinimaxGuess(Word("SNAKE"), False, 5, 20),
+            MinimaxGuess(Word("SHARK"), False, 5, 20),
+            MinimaxGuess(Word("CRANE"), True, 4, 20),
+            MinimaxGuess(Word("TRACE"), True, 6, 20),
+            MinimaxGuess(Word("ABBEY"), False, 9, 21),
+            MinimaxGuess(Word("ZEBRA"), True, 1, 19),
+        ]
+
+        # Act
+        sorted_by_key = sorted(guesses, key=MinimaxGuess.sort_key)
+        sorted_by_comparison = sorted(guesses)
+
+        # Assert
+        assert sorted_by_key == sorted_by_comparison
+        assert [str(g) for g in sorted_by_key] == ["ZEBRA", "TRACE", "CRANE", "SHARK", "SNAKE", "ABBEY"]
+
     def test_minimax_guess_against_different_guess_raises(self) -> None:
         # Arrange
         word1 = Word("SNAKE")
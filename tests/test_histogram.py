@@ -1,9 +1,18 @@
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
+from pytest import MonkeyPatch
 
-from doddle.guess import MinimaxGuess
-from doddle.histogram import HistogramBuilder, ScoreMatrix, _populate_histogram
+from doddle import histogram
+from doddle.guess import EntropyGuess, MinimaxGuess
+from doddle.histogram import (
+    HistogramBuilder,
+    ScoreMatrix,
+    _minimax_best_of_range,
+    _minimax_best_parallel,
+    _populate_histogram,
+)
 from doddle.scoring import Scorer, from_ternary
 from doddle.words import Word, WordSeries
 from tests.fake_dictionary import load_test_dictionary
@@ -79,6 +88,76 @@ class TestHistogramBuilder:
         for g in guesses:
             assert g.is_potential_soln ^ (g.word == guess)
 
+    def test_minimax_best_agrees_with_evaluate_all_guesses(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        potential_solns = potential_solns[::3]
+        histogram_builder = HistogramBuilder(scorer, all_words, potential_solns)
+
+        # Act
+        stats = histogram_builder.evaluate_all_guesses(all_words, potential_solns)
+        best = histogram_builder.minimax_best(all_words, potential_solns)
+
+        # Assert
+        largest, num_buckets = stats["largest"], stats["num_buckets"]
+        is_potential_soln = stats["is_potential_soln"]
+        keys = [(largest[i], not is_potential_soln[i], -num_buckets[i], i) for i in range(len(stats))]
+        i = min(keys)[-1]
+        assert best == (i, largest[i], num_buckets[i], is_potential_soln[i])
+
+    @pytest.mark.parametrize("num_chunks", [1, 3, 16, 10_000])
+    def test_parallel_minimax_search_agrees_with_serial_search(self, num_chunks: int) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        histogram_builder = HistogramBuilder(scorer, all_words, potential_solns, lazy_eval=False)
+        args = (histogram_builder.score_matrix._storage, all_words.index, potential_solns.index, 243)
+
+        # Act
+        expected = _minimax_best_of_range(*args, 0, len(all_words))
+        actual = _minimax_best_parallel(*args, num_chunks)
+
+        # Assert
+        assert actual == expected
+
+    @patch.object(histogram, "MIN_SOLNS_FOR_PARALLEL_SEARCH", 10)
+    @patch.object(histogram, "_minimax_best_parallel", wraps=_minimax_best_parallel)
+    @patch.object(histogram, "get_num_threads")
+    def test_minimax_best_searches_in_parallel_with_many_threads(
+        self, patch_get_num_threads: MagicMock, spy_minimax_best_parallel: MagicMock
+    ) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        histogram_builder = HistogramBuilder(scorer, all_words, potential_solns)
+
+        # Act
+        patch_get_num_threads.return_value = 1
+        expected = histogram_builder.minimax_best(all_words, potential_solns)
+        patch_get_num_threads.return_value = 4
+        actual = histogram_builder.minimax_best(all_words, potential_solns)
+
+        # Assert
+        assert actual == expected
+        spy_minimax_best_parallel.assert_called_once()
+
+    def test_evaluate_all_guesses_agrees_with_histograms(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        potential_solns = potential_solns[::3]
+        histogram_builder = HistogramBuilder(scorer, all_words, potential_solns)
+        guesses = histogram_builder.stream(all_words, potential_solns, EntropyGuess.from_histogram)
+
+        # Act
+        stats = histogram_builder.evaluate_all_guesses(all_words, potential_solns)
+
+        # Assert
+        for guess, (_, _, is_potential_soln, entropy) in zip(guesses, stats):
+            assert guess.is_potential_soln == is_potential_soln
+            assert abs(guess.entropy - entropy) < 1e-12
+
     def test_populate_histogram(self) -> None:
         # Arrange
         matrix = np.array(
@@ -146,3 +225,98 @@ class TestScoreMatrix:
 
         # Assert
         patch_precompute.assert_not_called()
+
+    def test_precompute_persists_matrix_for_later_sessions(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        first = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=False)
+
+        # Act
+        with patch.object(Scorer, "score_matrix") as patch_score_matrix:
+            second = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=False)
+
+        # Assert
+        patch_score_matrix.assert_not_called()
+        assert first.cache_path is not None and first.cache_path.exists()
+        assert second.is_fully_initialized
+        assert np.array_equal(first._storage, second._storage)
+
+    def test_cache_is_keyed_by_the_words(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+
+        # Act
+        sut1 = ScoreMatrix(scorer, all_words, potential_solns)
+        sut2 = ScoreMatrix(scorer, all_words, potential_solns[:-1])
+
+        # Assert
+        assert sut1.cache_path != sut2.cache_path
+
+    def test_cache_can_be_disabled(self, monkeypatch: MonkeyPatch) -> None:
+        # Arrange
+        monkeypatch.setenv("DODDLE_CACHE_DIR", "")
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+
+        # Act
+        sut = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=False)
+
+        # Assert
+        assert sut.cache_path is None
+        assert sut.is_fully_initialized
+
+    def test_cache_keeps_only_the_latest_matrix(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        first = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=False)
+
+        # Act
+        second = ScoreMatrix(scorer, all_words, potential_solns[:-1], lazy_eval=False)
+
+        # Assert
+        assert first.cache_path is not None and second.cache_path is not None
+        assert not first.cache_path.exists()
+        assert list(second.cache_path.parent.iterdir()) == [second.cache_path]
+
+    def test_cache_only_holds_five_letter_matrices(self) -> None:
+        # Arrange
+        all_words, potential_solns = load_test_dictionary().words
+
+        # Act
+        sut = ScoreMatrix(Scorer(6), all_words, potential_solns)
+
+        # Assert
+        assert sut.cache_path is None
+
+    def test_get_scores_caches_row_of_guess(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        sut = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=True)
+        guess = Word("SNAKE")
+        row = all_words.find_index(guess)
+        solns = potential_solns[:10]
+
+        # Act
+        scores = sut.get_scores(solns, guess)
+
+        # Assert
+        assert scores is not None
+        assert all(scores == [scorer.score_word(soln, guess) for soln in solns])
+        assert sut.is_row_calculated[row]
+        assert not np.any(sut.is_calculated)
+
+    def test_get_scores_of_unknown_guess_returns_none(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        sut = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=True)
+
+        # Act
+        scores = sut.get_scores(potential_solns, Word("ZZZZZ"))
+
+        # Assert
+        assert scores is None
@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
-from doddle.scoring import Scorer, _score_word_jit, score_word_slow, to_ternary
-from doddle.words import Word
+from doddle.scoring import Scorer, _score_word_jit, from_ternary, to_ternary
+from doddle.words import MAX_PACKED_WORD_LENGTH, Word, WordSeries
 
 
 class TestScorer:
@@ -54,13 +55,35 @@ class TestScorer:
 
         # Act
         score = sut.score_word(soln, guess)
-        score_slow = score_word_slow(soln, guess)
         non_jit_score = _score_word_jit.py_func(soln.vector, guess.vector, sut._powers)
         ternary = to_ternary(score, 5)
 
         # Assert
         assert ternary == expected
-        assert score == score_slow
+        assert score == non_jit_score
+
+    @pytest.mark.parametrize(
+        "soln_str,guess_str,expected",
+        [
+            ("JAZZY", "*****", "00000"),
+            ("*****", "JAZZY", "00000"),
+            ("**A**", "A****", "12122"),
+        ],
+    )
+    def test_score_word_with_non_alphabetic_characters(
+        self, soln_str: str, guess_str: str, expected: str
+    ) -> None:
+        # Arrange
+        sut = Scorer()
+        soln = Word(soln_str)
+        guess = Word(guess_str)
+
+        # Act
+        score = sut.score_word(soln, guess)
+        non_jit_score = _score_word_jit.py_func(soln.vector, guess.vector, sut._powers)
+
+        # Assert
+        assert to_ternary(score, 5) == expected
         assert score == non_jit_score
 
     def test_is_perfect_score(self) -> None:
@@ -76,3 +99,152 @@ class TestScorer:
         # Assert
         assert sut.is_perfect_score(agree_score)
         assert not sut.is_perfect_score(wrong_score)
+
+    def test_score_words(self) -> None:
+        # Arrange
+        sut = Scorer()
+        solns = WordSeries(["SPEAR", "PERKY", "GAMMA", "ARGUE"])
+        guess = Word("AGREE")
+
+        # Act
+        scores = sut.score_words(solns, guess)
+
+        # Assert
+        assert len(scores) == len(solns)
+        for soln, score in zip(solns, scores):
+            assert score == sut.score_word(soln, guess)
+
+    @pytest.mark.parametrize("size,expected", [(5, np.uint8), (9, np.uint16), (11, np.uint32)])
+    def test_scores_use_smallest_dtype(self, size: int, expected: type) -> None:
+        # Arrange
+        sut = Scorer(size)
+        guess = Word("A" * size)
+        solns = WordSeries([guess.value])
+
+        # Act
+        scores = sut.score_words(solns, guess)
+
+        # Assert
+        assert sut.dtype == expected
+        assert scores.dtype == expected
+        assert scores[0] == sut.perfect_score
+
+    def test_score_matrix(self) -> None:
+        # Arrange
+        sut = Scorer()
+        solns = WordSeries(["SPEAR", "PERKY", "GAMMA"])
+        guesses = WordSeries(["AGREE", "MAGIC", "SPEAK", "TEARS"])
+
+        # Act
+        matrix = sut.score_matrix(solns, guesses)
+
+        # Assert
+        assert matrix.shape == (len(guesses), len(solns))
+        for i, guess in enumerate(guesses):
+            for j, soln in enumerate(solns):
+                assert matrix[i, j] == sut.score_word(soln, guess)
+
+    @pytest.mark.parametrize("solns", [["OLEA", "AREA", "LOAD"], ["TAILER", "RETAIL", "LATTER"]])
+    def test_score_matrix_is_specialised_to_word_length(self, solns: list[str]) -> None:
+        # Arrange
+        series = WordSeries(solns)
+        sut = Scorer(series.word_length)
+
+        # Act
+        matrix = sut.score_matrix(series, series)
+
+        # Assert
+        for i, guess in enumerate(series):
+            for j, soln in enumerate(series):
+                assert matrix[i, j] == sut.score_word(soln, guess)
+
+    @pytest.mark.parametrize("size", [1, 5, MAX_PACKED_WORD_LENGTH, MAX_PACKED_WORD_LENGTH + 1])
+    def test_batched_scores_agree_with_score_word(self, size: int) -> None:
+        # Arrange
+        rng = np.random.default_rng(size)
+        letters = np.array(list("AEIRSTZ"))
+        series = WordSeries(["".join(rng.choice(letters, size)) for _ in range(40)])
+        guess = series.iloc[7]
+        sut = Scorer(size)
+
+        # Act
+        matrix = sut.score_matrix(series, series)
+        scores = sut.score_words(series, guess)
+
+        # Assert
+        assert (series.codes is None) == (size > MAX_PACKED_WORD_LENGTH)
+        for i, guess_i in enumerate(series):
+            for j, soln in enumerate(series):
+                assert matrix[i, j] == sut.score_word(soln, guess_i)
+        assert np.all(scores == matrix[7])
+
+    @pytest.mark.parametrize("size", [5, MAX_PACKED_WORD_LENGTH + 1])
+    def test_batched_scores_agree_with_score_word_for_non_letters(self, size: int) -> None:
+        # Arrange
+        rng = np.random.default_rng(size)
+        letters = np.array(list("AEIRSTZ*-+"))
+        series = WordSeries(["".join(rng.choice(letters, size)) for _ in range(40)])
+        letter_solns = WordSeries(["".join(rng.choice(letters[:8], size)) for _ in range(40)])
+        sut = Scorer(size)
+
+        # Act
+        matrix = sut.score_matrix(series, series)
+        letter_soln_scores = [sut.score_words(letter_solns, guess) for guess in series]
+
+        # Assert
+        for i, guess in enumerate(series):
+            assert np.all(sut.score_words(series, guess) == matrix[i])
+            for j, soln in enumerate(series):
+                assert matrix[i, j] == sut.score_word(soln, guess)
+            for j, soln in enumerate(letter_solns):
+                assert letter_soln_scores[i][j] == sut.score_word(soln, guess)
+
+    @pytest.mark.parametrize(
+        "soln_str,guess_str,expected",
+        [
+            ("AB-CD", "AB*CD", "22022"),
+            ("AB-CD", "*B-CD", "02222"),
+            ("A-*-B", "-*A+-", "11101"),
+            ("A-*-B", "--**-", "12200"),
+        ],
+    )
+    def test_distinct_non_letters_never_match(
+        self, soln_str: str, guess_str: str, expected: str
+    ) -> None:
+        # Arrange
+        sut = Scorer(5)
+        soln, guess = Word(soln_str), Word(guess_str)
+
+        # Act
+        score = sut.score_word(soln, guess)
+        scores = sut.score_words(WordSeries([soln_str, "ABCDE"]), guess)
+
+        # Assert
+        assert score == from_ternary(expected)
+        assert scores[0] == from_ternary(expected)
+
+
+class TestTernary:
+    @pytest.mark.parametrize("size", [1, 3, 5])
+    def test_to_ternary_round_trips(self, size: int) -> None:
+        # Arrange
+        scores = range(3**size)
+
+        # Act
+        ternaries = [to_ternary(score, size) for score in scores]
+
+        # Assert
+        assert all(len(ternary) == size for ternary in ternaries)
+        assert [from_ternary(ternary) for ternary in ternaries] == list(scores)
+
+    @pytest.mark.parametrize("size", [9, 10, 15])
+    def test_to_ternary_round_trips_long_words(self, size: int) -> None:
+        # Arrange
+        scores = [0, 1, 3**size // 2, 3**size - 1]
+
+        # Act
+        ternaries = [to_ternary(score, size) for score in scores]
+
+        # Assert
+        assert all(len(ternary) == size for ternary in ternaries)
+        assert [from_ternary(ternary) for ternary in ternaries] == scores
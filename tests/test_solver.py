@@ -2,6 +2,7 @@ from doddle.histogram import HistogramBuilder
 from doddle.scoring import Scorer
 from doddle.solver import DeepEntropySolver, DeepMinimaxSolver, EntropySolver, MinimaxSolver
 from doddle.words import Word, WordSeries
+from tests.fake_dictionary import load_test_dictionary
 
 
 class TestMinimaxSolver:
@@ -25,6 +26,35 @@ class TestMinimaxSolver:
         # Assert
         assert best_guess.word == Word("TRASH")
 
+    def test_best_guesses_agree_with_sorting_all_guesses(self) -> None:
+        # Arrange
+        all_words, potential_solns = load_test_dictionary().words
+        potential_solns = potential_solns[::5]
+        histogram_builder = HistogramBuilder(Scorer(), all_words, potential_solns)
+        sut = MinimaxSolver(histogram_builder)
+        expected = sorted(sut.hist_builder.stream(all_words, potential_solns, sut._build_guess))[:10]
+
+        # Act
+        best_guesses = sut.best_guesses(all_words, potential_solns, 10)
+
+        # Assert
+        assert [guess.word for guess in best_guesses] == [guess.word for guess in expected]
+
+    def test_seed(self) -> None:
+        # Arrange
+        dictionary = load_test_dictionary()
+        scorer = Scorer(dictionary.word_length)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        sut = MinimaxSolver(histogram_builder)
+
+        expected = Word("TAILER")
+
+        # Act
+        actual = sut.seed(6)
+
+        # Assert
+        assert actual == expected
+
 
 class TestDeepMinimaxSolver:
     def test_get_best_guess(self) -> None:
@@ -107,6 +137,35 @@ class TestEntropySolver:
         # Assert
         assert best_guess.word == Word("PLANT")
 
+    def test_best_guesses_agree_with_sorting_all_guesses(self) -> None:
+        # Arrange
+        all_words, potential_solns = load_test_dictionary().words
+        potential_solns = potential_solns[::5]
+        histogram_builder = HistogramBuilder(Scorer(), all_words, potential_solns)
+        sut = EntropySolver(histogram_builder)
+        expected = sorted(sut.hist_builder.stream(all_words, potential_solns, sut._build_guess))[:10]
+
+        # Act
+        best_guesses = sut.best_guesses(all_words, potential_solns, 10)
+
+        # Assert
+        assert [guess.word for guess in best_guesses] == [guess.word for guess in expected]
+
+    def test_seed(self) -> None:
+        # Arrange
+        dictionary = load_test_dictionary()
+        scorer = Scorer(dictionary.word_length)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        sut = EntropySolver(histogram_builder)
+
+        expected = Word("OLEA")
+
+        # Act
+        actual = sut.seed(4)
+
+        # Assert
+        assert actual == expected
+
 
 class TestDeepEntropySolver:
     def test_get_best_guess(self) -> None:
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from doddle.words import Dictionary, Word, WordSeries, load_dictionary
+from doddle.words import MAX_PACKED_WORD_LENGTH, Dictionary, Word, WordSeries, load_dictionary
 
 
 class TestWords:
@@ -93,6 +93,61 @@ class TestWordSeries:
         assert np.all(sliced.index == expected_index)
         assert np.all(sliced.words == expected_words)
 
+    def test_wordseries_vectors_are_sliced_with_words(self) -> None:
+        # Arrange
+        series = WordSeries(["SNAKE", "SHARK", "RAISE", "CRANE"])
+        mask = np.array([True, False, True, False])
+
+        # Act
+        sliced = series[mask]
+
+        # Assert
+        assert series.vectors.shape == (4, 5)
+        assert sliced.vectors.shape == (2, 5)
+        for word, vector in zip(sliced, sliced.vectors):
+            assert np.all(word.vector == vector)
+
+    def test_wordseries_vectors_match_word_vectors(self) -> None:
+        # Arrange
+        words = ["snake", "*****", "ZEBRA"]
+
+        # Act
+        series = WordSeries(words)
+
+        # Assert
+        assert series.vectors.dtype == np.int8
+        for word, vector in zip(series, series.vectors):
+            assert np.all(Word.to_vector(word.value) == vector)
+
+    def test_wordseries_codes_pack_letters_and_are_sliced_with_words(self) -> None:
+        # Arrange
+        series = WordSeries(["SNAKE", "SHARK", "RAISE", "CRANE"])
+        mask = np.array([True, False, True, False])
+        expected = sum(int(letter) << (5 * k) for k, letter in enumerate(Word("CRANE").vector))
+
+        # Act
+        sliced = series[mask]
+
+        # Assert
+        assert series.codes is not None and sliced.codes is not None
+        assert series.codes[0] == expected
+        assert np.all(sliced.codes == WordSeries(["CRANE", "SHARK"]).codes)
+
+    def test_wordseries_codes_require_short_words_of_letters_or_asterisks(self) -> None:
+        # Arrange
+        long_word = "A" * (MAX_PACKED_WORD_LENGTH + 1)
+
+        # Act
+        series1 = WordSeries(["SNAKE", "SH-RK"])
+        series2 = WordSeries([long_word])
+        series3 = WordSeries(["SNAKE", "*****"])
+
+        # Assert
+        assert series1.codes is None
+        assert series1[np.array([True, False])].codes is None
+        assert series2.codes is None
+        assert series3.codes is not None
+
     def test_wordseries_find_index(self) -> None:
         # Arrange
         alphabet = [chr(i + ord("A")) for i in np.arange(0, 26)]
@@ -108,6 +163,20 @@ class TestWordSeries:
         assert index2 == -1
         assert np.all(index3 == np.array([2, 4]))
 
+    def test_wordseries_find_index_vectorised_misses(self) -> None:
+        # Arrange
+        series = WordSeries(["PQR", "ABC", "XYZ"])
+        words = np.array(["AAA", "abc", "PQ", "PQRS", "xyz", "ZZZ"])
+        expected = np.array([-1, 0, -1, -1, 2, -1])
+
+        # Act
+        indices = series.find_index(words)
+        empty_indices = WordSeries([]).find_index(words)
+
+        # Assert
+        assert np.all(indices == expected)
+        assert np.all(empty_indices == -1)
+
     def test_wordseries_contains(self) -> None:
         # Arrange
         series = WordSeries(["XYZ", "ABC", "PQR"])
@@ -177,6 +246,11 @@ class TestWordSeries:
         with pytest.raises(ValueError):
             series[["ABC", "XYZ"]]
 
+    def test_wordseries_raises_if_lengths_differ(self) -> None:
+        # Act + Assert
+        with pytest.raises(ValueError):
+            WordSeries(["ABCDE", "SALT", "SALTED", "ZZZZZ"])
+
 
 class TestDictionary:
     def test_wordseries_regular_index_slice(self) -> None:
@@ -214,3 +288,20 @@ class TestDictionary:
         # Assert
         assert len(all_words) == 15787
         assert len(common_words) == 4563
+
+    def test_load_dictionary_reuses_words_without_leaking_extras(self) -> None:
+        # Arrange
+        size = 5
+        extras = [Word("QQQQQ")]
+
+        # Act
+        dictionary1 = load_dictionary(size)
+        dictionary2 = load_dictionary(size, extras)
+        dictionary3 = load_dictionary(size)
+
+        # Assert
+        assert dictionary3.all_words is dictionary1.all_words
+        assert dictionary3.common_words is dictionary1.common_words
+        assert "QQQQQ" in dictionary2.common_words
+        assert "QQQQQ" in dictionary2.all_words
+        assert "QQQQQ" not in dictionary3.all_words